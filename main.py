@@ -2,7 +2,7 @@
 """
 WinSCP Manager - Main Entry Point
 
-A comprehensive Python application for managing WinSCP/SFTP file operations 
+A comprehensive Python application for managing WinSCP/SFTP file operations
 with advanced scheduling capabilities and dual interfaces (GUI and Console).
 
 Author: Pandiyaraj Karuppasamy
@@ -12,46 +12,89 @@ Version: 1.0.0
 """
 
 import sys
-import argparse
-import logging
 
 
-def main():
-    """Main entry point"""
-    parser = argparse.ArgumentParser(
-        description='WinSCP Manager - File Transfer & Scheduler',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+VERSION_STRING = 'WinSCP Manager 1.0.0'
+
+DESCRIPTION = 'WinSCP Manager - File Transfer & Scheduler'
+
+EPILOG = """
 Examples:
   python main.py              # Run GUI interface (default)
   python main.py --gui        # Run GUI interface
   python main.py --console    # Run console interface
   python main.py --help       # Show this help message
         """
+
+
+def _fast_dispatch(argv):
+    """
+    Resolve the common invocations without building an ArgumentParser
+
+    Args:
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        'gui' or 'console' for a recognised invocation, None when the
+        arguments need the full argparse treatment
+    """
+    if not argv:
+        return 'gui'
+    if len(argv) > 1:
+        return None
+
+    # --help is left to argparse, so its text has a single source
+    flag = argv[0]
+    if flag == '--version':
+        sys.stdout.write(VERSION_STRING + '\n')
+        sys.exit(0)
+    if flag == '--console':
+        return 'console'
+    if flag == '--gui':
+        return 'gui'
+    return None
+
+
+def _parse_args():
+    """Parse command line arguments with argparse"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
     )
-    
+
     parser.add_argument(
         '--gui',
         action='store_true',
         help='Run GUI interface (default)'
     )
-    
+
     parser.add_argument(
         '--console',
         action='store_true',
         help='Run console interface'
     )
-    
+
     parser.add_argument(
         '--version',
         action='version',
-        version='WinSCP Manager 1.0.0'
+        version=VERSION_STRING
     )
-    
+
     args = parser.parse_args()
-    
+    return 'console' if args.console else 'gui'
+
+
+def main():
+    """Main entry point"""
+    mode = _fast_dispatch(sys.argv[1:])
+    if mode is None:
+        mode = _parse_args()
+
     # Determine which interface to run
-    if args.console:
+    if mode == 'console':
         print("Starting console interface...")
         from winscp_manager.console import run_console
         run_console()
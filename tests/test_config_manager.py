@@ -0,0 +1,100 @@
+"""
+Tests for configuration loading
+"""
+
+import configparser
+import os
+
+import pytest
+
+from winscp_manager.config_manager import DEFAULT_SECTION, ConfigManager, _parse_ini
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_forced_reload_sees_edit_with_same_mtime_and_size(tmp_path):
+    """load_config(force=True) re-reads a file whose stat looks unchanged"""
+    path = tmp_path / "config.ini"
+    path.write_text("[DEFAULT]\nhost = aaaa\nusername = user\n")
+    manager = ConfigManager(str(path))
+    st = os.stat(path)
+
+    # Same size, mtime restored: what a coarse-mtime filesystem reports
+    path.write_text("[DEFAULT]\nhost = bbbb\nusername = user\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    manager.load_config()
+    assert manager.get_connection_details()['host'] == 'aaaa'
+    manager.load_config(force=True)
+    assert manager.get_connection_details()['host'] == 'bbbb'
+
+
+def _configparser_sections(path):
+    """Read a file with ConfigParser into the shape _parse_ini returns"""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(path, encoding='utf-8')
+    sections = {DEFAULT_SECTION: dict(parser.defaults())}
+    # Section proxies also show DEFAULT keys, so read each section's own ones
+    for name in parser.sections():
+        sections[name] = dict(parser._sections[name])
+    return sections
+
+
+@pytest.mark.parametrize('name', ['config.ini', 'example_config.ini'])
+def test_parse_ini_matches_configparser_on_shipped_files(name):
+    """The bundled config files parse the same as with ConfigParser"""
+    path = os.path.join(REPO_ROOT, name)
+    assert _parse_ini(path) == _configparser_sections(path)
+
+
+def test_parse_ini_matches_configparser_on_edge_cases(tmp_path):
+    """Continuation lines, ':' delimiters and empty values match ConfigParser"""
+    path = tmp_path / "config.ini"
+    path.write_text(
+        "[DEFAULT]\n"
+        "Host = example.com\n"
+        "empty =\n"
+        "\n"
+        "[PATHS]\n"
+        "; comment\n"
+        "remote_dir: /remote/path\n"
+        "url = http://example.com:8080/a=b\n"
+        "pattern: a=b\n"
+        "blank:\n"
+        "multi = first\n"
+        "    second\n"
+        "\tthird\n"
+        "\n"
+        "    after a blank line\n"
+        "# comment between values\n"
+        "after = value\n"
+        "\n"
+        "[  spaced  ]\n"
+        "key = value with = sign\n"
+    )
+    assert _parse_ini(str(path)) == _configparser_sections(str(path))
+
+
+def test_update_config_round_trips_through_both_parsers(tmp_path):
+    """A file written by update_config reads back the same with either parser"""
+    path = tmp_path / "config.ini"
+    path.write_text(
+        "[DEFAULT]\n"
+        "host = example.com\n"
+        "username = user\n"
+        "\n"
+        "[PATHS]\n"
+        "multi = first\n"
+        "    second\n"
+    )
+    manager = ConfigManager(str(path))
+    manager.update_config('PATHS', 'Local_Dir', './downloads')
+    manager.update_config('LOGGING', 'log_file', '')
+    manager.update_config('DEFAULT', 'port', 2222)
+
+    parsed = _parse_ini(str(path))
+    assert parsed == _configparser_sections(str(path))
+    assert parsed['PATHS'] == {'multi': 'first\nsecond', 'local_dir': './downloads'}
+    assert parsed['LOGGING'] == {'log_file': ''}
+    assert parsed[DEFAULT_SECTION]['port'] == '2222'
@@ -0,0 +1,156 @@
+"""
+Tests for the task scheduler
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from winscp_manager.scheduler import TaskScheduler, ScheduledTask, TaskType, TaskStatus
+
+
+def _task(task_id):
+    return ScheduledTask(task_id, TaskType.DELETE, '/remote/file.txt')
+
+
+def test_two_schedulers_on_one_file_keep_both_tasks(tmp_path):
+    """A stale instance flushing last must not drop another instance's tasks"""
+    tasks_file = str(tmp_path / "scheduled_tasks.json")
+
+    first = TaskScheduler(tasks_file)
+    first.add_task(_task('t1'))
+    # What the background writer does once save_delay has passed
+    first._append_changes()
+
+    second = TaskScheduler(tasks_file)
+    second.add_task(_task('t2'))
+
+    # atexit runs hooks last-registered first
+    second.flush()
+    first.flush()
+
+    assert set(TaskScheduler(tasks_file).tasks) == {'t1', 't2'}
+
+
+def test_unsaved_change_survives_other_instance_compacting(tmp_path):
+    """Records appended after another instance compacted are replayed on load"""
+    tasks_file = str(tmp_path / "scheduled_tasks.json")
+
+    first = TaskScheduler(tasks_file)
+    first.add_task(_task('t1'))
+
+    second = TaskScheduler(tasks_file)
+    second.add_task(_task('t2'))
+    second.flush()
+    first.flush()
+
+    assert set(TaskScheduler(tasks_file).tasks) == {'t1', 't2'}
+
+
+def test_unserializable_task_does_not_break_saves(tmp_path):
+    """A task whose to_dict() fails is skipped, never written as null"""
+    tasks_file = str(tmp_path / "scheduled_tasks.json")
+
+    scheduler = TaskScheduler(tasks_file)
+    scheduler.add_task(_task('good'))
+    scheduler.flush()
+
+    bad = ScheduledTask('bad', 'delete', '/remote/file.txt')
+    for _ in range(2):
+        try:
+            bad.to_dict()
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("to_dict() must keep failing, not return a stale cache")
+
+    scheduler.add_task(bad)
+    scheduler._append_changes()
+
+    assert set(TaskScheduler(tasks_file).tasks) == {'good'}
+
+
+def test_stale_instance_rebases_and_compacts(tmp_path):
+    """An instance that sees another's writes merges them and still compacts"""
+    tasks_file = str(tmp_path / "scheduled_tasks.json")
+
+    first = TaskScheduler(tasks_file)
+    second = TaskScheduler(tasks_file)
+    first.add_task(_task('t1'))
+    first._append_changes()
+    second.add_task(_task('t2'))
+    second._append_changes()
+
+    second.flush()
+    assert os.path.getsize(second.log_file) == 0
+    first.flush()
+    assert os.path.getsize(first.log_file) == 0
+
+    assert set(first.tasks) == {'t1', 't2'}
+    assert set(TaskScheduler(tasks_file).tasks) == {'t1', 't2'}
+
+
+def test_bad_log_record_keeps_snapshot_and_other_records(tmp_path):
+    """A malformed change-log record is skipped instead of aborting the load"""
+    tasks_file = str(tmp_path / "scheduled_tasks.json")
+
+    scheduler = TaskScheduler(tasks_file)
+    scheduler.add_task(_task('t1'))
+    scheduler.flush()
+    scheduler.add_task(_task('t2'))
+    scheduler._append_changes()
+    with open(scheduler.log_file, 'ab') as f:
+        f.write(b'{"task": {"task_id": "t3"}}\n')
+        f.write(b'{"op": "put", "task": {"task_id": "t4"}}\n')
+        f.write(b'{"op": "del", "task_id": "t1"}\n')
+        f.write(b'{"op": "pu')
+
+    assert set(TaskScheduler(tasks_file).tasks) == {'t2'}
+    # The bad lines were compacted away on load
+    assert os.path.getsize(scheduler.log_file) == 0
+
+
+def test_failed_dispatch_puts_task_back_to_pending(tmp_path):
+    """Due tasks are not stranded RUNNING when the pool rejects them"""
+    scheduler = TaskScheduler(str(tmp_path / "scheduled_tasks.json"))
+    scheduler.set_task_executor(lambda task: True)
+    task = ScheduledTask('t1', TaskType.DELETE, '/remote/file.txt',
+                         scheduled_time=datetime.now() - timedelta(seconds=1))
+    scheduler.add_task(task)
+
+    # What stop() leaves behind once it has shut the pool down
+    scheduler._pool = ThreadPoolExecutor(max_workers=1)
+    scheduler._pool.shutdown()
+    with pytest.raises(RuntimeError):
+        scheduler._check_and_execute_tasks()
+
+    assert task.status is TaskStatus.PENDING
+    assert [task_id for _, task_id in scheduler._heap] == ['t1']
+
+
+def test_async_run_executes_task_and_stops(tmp_path):
+    """run() dispatches a due task through the pool and returns after stop()"""
+    scheduler = TaskScheduler(str(tmp_path / "scheduled_tasks.json"))
+    ran = []
+    scheduler.set_task_executor(lambda task: ran.append(task.task_id) or True)
+
+    async def drive():
+        runner = asyncio.ensure_future(scheduler.run())
+        await asyncio.sleep(0.05)
+        scheduler.add_task(ScheduledTask('t1', TaskType.DELETE, '/remote/file.txt',
+                                         scheduled_time=datetime.now() + timedelta(seconds=0.1)))
+        for _ in range(100):
+            if ran:
+                break
+            await asyncio.sleep(0.02)
+        scheduler.stop()
+        await asyncio.wait_for(runner, timeout=5)
+
+    asyncio.run(drive())
+
+    assert ran == ['t1']
+    assert scheduler.get_task('t1').status is TaskStatus.COMPLETED
+    assert not scheduler.running
@@ -20,3 +20,20 @@ __all__ = [
     'gui',
     'console'
 ]
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# ``import winscp_manager`` does not pull in tkinter or paramiko.
+_LAZY_SUBMODULES = frozenset(__all__)
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
@@ -2,9 +2,75 @@
 Configuration Manager for WinSCP credentials and settings
 """
 
-import configparser
 import os
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+DEFAULT_SECTION = 'DEFAULT'
+
+# Same spellings ConfigParser.getboolean() accepts
+_BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
+                   '0': False, 'no': False, 'false': False, 'off': False}
+
+_MISSING = object()
+
+# Parsed file contents keyed by (absolute path, mtime, size), so repeated
+# ConfigManager instances for an unchanged file skip parsing it again
+_PARSED_FILES: Dict[Tuple[str, float, int], Dict[str, Dict[str, str]]] = {}
+
+
+def _parse_ini(path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse a simple INI file into plain dictionaries
+    
+    Handles the subset of the format config.ini uses: [section] headers,
+    key = value or key: value pairs, full-line # and ; comments and
+    indented continuation lines, which keep any blank lines between them.
+    Keys are lower-cased like ConfigParser.
+    
+    Args:
+        path: Path to the INI file
+        
+    Returns:
+        Mapping of section name to its key/value pairs
+    """
+    data: Dict[str, Dict[str, str]] = {DEFAULT_SECTION: {}}
+    values = data[DEFAULT_SECTION]
+    last_key = None
+    # Blank lines only count if a continuation line follows them
+    blank_lines = 0
+    
+    with open(path, 'r', encoding='utf-8', buffering=65536) as f:
+        for lineno, line in enumerate(f, 1):
+            stripped = line.strip()
+            if not stripped:
+                blank_lines += 1
+                continue
+            if stripped[0] in '#;':
+                continue
+            
+            if line[0] in ' \t' and last_key is not None:
+                gap = "\n" * (blank_lines + 1)
+                values[last_key] = f"{values[last_key]}{gap}{stripped}".strip()
+                blank_lines = 0
+                continue
+            blank_lines = 0
+            
+            if stripped[0] == '[' and stripped[-1] == ']':
+                values = data.setdefault(stripped[1:-1], {})
+                last_key = None
+                continue
+            
+            eq, colon = stripped.find('='), stripped.find(':')
+            pos = min(p for p in (eq, colon, len(stripped)) if p >= 0)
+            if pos in (0, len(stripped)):
+                raise ValueError(f"Invalid line {lineno} in {path}: {stripped!r}")
+            
+            last_key = stripped[:pos].strip().lower()
+            values[last_key] = stripped[pos + 1:].strip()
+    
+    return data
 
 
 class ConfigManager:
@@ -18,53 +84,149 @@ class ConfigManager:
             config_path: Path to the configuration file
         """
         self.config_path = config_path
-        self.config = configparser.ConfigParser()
+        self._data: Dict[str, Dict[str, str]] = {DEFAULT_SECTION: {}}
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._mtime: Optional[float] = None
         self.load_config()
     
-    def load_config(self) -> None:
-        """Load configuration from file"""
-        if not os.path.exists(self.config_path):
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+    @property
+    def config(self):
+        """
+        ConfigParser snapshot of the current settings, for callers that
+        still expect one. Edits to it are not saved; use update_config.
+        """
+        import configparser
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read_dict(self._data)
+        return parser
+    
+    def load_config(self, force: bool = False) -> None:
+        """
+        Load configuration from file
+        
+        Args:
+            force: Re-parse the file even if its mtime and size match the
+                memoised copy (coarse mtimes on FAT or network shares can
+                hide an edit)
+        """
+        try:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}") from None
+        
+        key = (os.path.abspath(self.config_path), st.st_mtime, st.st_size)
+        parsed = None if force else _PARSED_FILES.get(key)
+        if parsed is None:
+            parsed = _parse_ini(self.config_path)
+            for stale in [k for k in _PARSED_FILES if k[0] == key[0]]:
+                del _PARSED_FILES[stale]
+            _PARSED_FILES[key] = parsed
+        
+        # Private copy, update_config edits it in place
+        self._data = {name: dict(values) for name, values in parsed.items()}
+        self._mtime = st.st_mtime
+        self._cache.clear()
+    
+    def _get(self, section: str, key: str, fallback: Any = _MISSING) -> Any:
+        """
+        Look up a value, falling back to the DEFAULT section
         
-        self.config.read(self.config_path)
+        Raises:
+            KeyError: If the key is missing and no fallback is given
+        """
+        values = self._data.get(section)
+        if values is not None and key in values:
+            return values[key]
+        defaults = self._data[DEFAULT_SECTION]
+        if key in defaults:
+            return defaults[key]
+        if fallback is _MISSING:
+            raise KeyError(f"No option '{key}' in section: '{section}'")
+        return fallback
     
-    def get_connection_details(self) -> Dict[str, str]:
+    def _getint(self, section: str, key: str, fallback: Any = _MISSING) -> Any:
+        """Look up a value and convert it to int"""
+        try:
+            value = self._get(section, key)
+        except KeyError:
+            if fallback is _MISSING:
+                raise
+            return fallback
+        return int(value)
+    
+    def _getboolean(self, section: str, key: str, fallback: Any = _MISSING) -> Any:
+        """Look up a value and convert it to bool"""
+        try:
+            value = self._get(section, key)
+        except KeyError:
+            if fallback is _MISSING:
+                raise
+            return fallback
+        try:
+            return _BOOLEAN_STATES[value.lower()]
+        except KeyError:
+            raise ValueError(f"Not a boolean: {value}") from None
+    
+    def _maybe_reload(self) -> None:
+        """Re-read the configuration file if it changed on disk"""
+        try:
+            mtime = os.stat(self.config_path).st_mtime
+        except OSError:
+            return
+        
+        if mtime != self._mtime:
+            self.load_config()
+    
+    def _cached_section(self, key: str, build) -> Mapping[str, Any]:
+        """
+        Return a read-only cached view of a settings dictionary
+        
+        Args:
+            key: Cache key
+            build: Callable producing the dictionary on a cache miss
+        """
+        self._maybe_reload()
+        if key not in self._cache:
+            self._cache[key] = build()
+        return MappingProxyType(self._cache[key])
+    
+    def get_connection_details(self) -> Mapping[str, Any]:
         """
         Get WinSCP connection details from config
         
         Returns:
-            Dictionary containing connection parameters
+            Read-only mapping containing connection parameters
         """
-        return {
-            'protocol': self.config.get('DEFAULT', 'protocol', fallback='sftp'),
-            'host': self.config.get('DEFAULT', 'host'),
-            'port': self.config.getint('DEFAULT', 'port', fallback=22),
-            'username': self.config.get('DEFAULT', 'username'),
-            'password': self.config.get('DEFAULT', 'password', fallback=''),
-            'private_key_path': self.config.get('DEFAULT', 'private_key_path', fallback='')
-        }
-    
-    def get_paths(self) -> Dict[str, str]:
+        return self._cached_section('connection', lambda: {
+            'protocol': self._get('DEFAULT', 'protocol', fallback='sftp'),
+            'host': self._get('DEFAULT', 'host'),
+            'port': self._getint('DEFAULT', 'port', fallback=22),
+            'username': self._get('DEFAULT', 'username'),
+            'password': self._get('DEFAULT', 'password', fallback=''),
+            'private_key_path': self._get('DEFAULT', 'private_key_path', fallback='')
+        })
+    
+    def get_paths(self) -> Mapping[str, Any]:
         """Get path configurations"""
-        return {
-            'remote_upload_dir': self.config.get('PATHS', 'remote_upload_dir', fallback='/'),
-            'local_download_dir': self.config.get('PATHS', 'local_download_dir', fallback='./downloads'),
-            'temp_dir': self.config.get('PATHS', 'temp_dir', fallback='./temp')
-        }
+        return self._cached_section('paths', lambda: {
+            'remote_upload_dir': self._get('PATHS', 'remote_upload_dir', fallback='/'),
+            'local_download_dir': self._get('PATHS', 'local_download_dir', fallback='./downloads'),
+            'temp_dir': self._get('PATHS', 'temp_dir', fallback='./temp')
+        })
     
-    def get_scheduling_config(self) -> Dict:
+    def get_scheduling_config(self) -> Mapping[str, Any]:
         """Get scheduling configuration"""
-        return {
-            'enabled': self.config.getboolean('SCHEDULING', 'enabled', fallback=True),
-            'check_interval': self.config.getint('SCHEDULING', 'check_interval', fallback=60)
-        }
+        return self._cached_section('scheduling', lambda: {
+            'enabled': self._getboolean('SCHEDULING', 'enabled', fallback=True),
+            'check_interval': self._getint('SCHEDULING', 'check_interval', fallback=60)
+        })
     
-    def get_logging_config(self) -> Dict[str, str]:
+    def get_logging_config(self) -> Mapping[str, Any]:
         """Get logging configuration"""
-        return {
-            'log_file': self.config.get('LOGGING', 'log_file', fallback='winscp_manager.log'),
-            'log_level': self.config.get('LOGGING', 'log_level', fallback='INFO')
-        }
+        return self._cached_section('logging', lambda: {
+            'log_file': self._get('LOGGING', 'log_file', fallback='winscp_manager.log'),
+            'log_level': self._get('LOGGING', 'log_level', fallback='INFO')
+        })
     
     def update_config(self, section: str, key: str, value: str) -> None:
         """
@@ -75,10 +237,42 @@ class ConfigManager:
             key: Configuration key
             value: New value
         """
-        if section not in self.config:
-            self.config.add_section(section)
+        self._data.setdefault(section, {})[key.lower()] = str(value)
+        
+        # Same layout ConfigParser.write() produces
+        lines = []
+        for name, values in self._data.items():
+            lines.append(f"[{name}]")
+            for option, option_value in values.items():
+                option_value = option_value.replace('\n', '\n\t')
+                lines.append(f"{option} = {option_value}" if option_value else f"{option} =")
+            lines.append("")
         
-        self.config.set(section, key, value)
+        with open(self.config_path, 'w', encoding='utf-8') as configfile:
+            configfile.write("\n".join(lines) + "\n")
+        
+        self._mtime = os.stat(self.config_path).st_mtime
+        self._cache.clear()
+
+
+_INSTANCE: Optional[ConfigManager] = None
+
+
+def get_config_manager(config_path: str = "config.ini") -> ConfigManager:
+    """
+    Get the process-wide configuration manager
+    
+    The file is parsed once per process and reused by every caller. Changes
+    should go through ConfigManager.update_config so the file and the
+    cached settings stay in sync.
+    
+    Args:
+        config_path: Path to the configuration file
         
-        with open(self.config_path, 'w') as configfile:
-            self.config.write(configfile)
+    Returns:
+        Shared ConfigManager instance for config_path
+    """
+    global _INSTANCE
+    if _INSTANCE is None or _INSTANCE.config_path != config_path:
+        _INSTANCE = ConfigManager(config_path)
+    return _INSTANCE
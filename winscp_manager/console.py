@@ -6,17 +6,99 @@ import sys
 import os
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
-import uuid
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
 
-from .config_manager import ConfigManager
-from .winscp_handler import WinSCPHandler
-from .scheduler import TaskScheduler, ScheduledTask, TaskType, TaskStatus
+from .config_manager import get_config_manager
+
+if TYPE_CHECKING:
+    from .scheduler import ScheduledTask
+
+
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_MENU = "\n".join([
+    "\n" + "=" * 60,
+    "Main Menu",
+    "=" * 60,
+    "1. Connect to server",
+    "2. Disconnect from server",
+    "3. Upload file",
+    "4. Download file",
+    "5. Delete file",
+    "6. List remote files",
+    "7. Schedule task",
+    "8. View scheduled tasks",
+    "9. Remove scheduled task",
+    "10. Start scheduler",
+    "11. Stop scheduler",
+    "12. Exit",
+    "=" * 60
+])
+
+
+# The SFTP stack (paramiko, cryptography) and the scheduler are only
+# imported once a menu action needs them, keeping console startup light.
+@lru_cache(maxsize=1)
+def _handler_cls():
+    """Return the WinSCPHandler class, importing it on first use"""
+    from .winscp_handler import WinSCPHandler
+    return WinSCPHandler
+
+
+@lru_cache(maxsize=1)
+def _sched_mod():
+    """Return the scheduler module, importing it on first use"""
+    from . import scheduler
+    return scheduler
+
+
+@lru_cache(maxsize=1)
+def _task_types():
+    """Return the (UPLOAD, DOWNLOAD, DELETE) TaskType members"""
+    TaskType = _sched_mod().TaskType
+    return TaskType.UPLOAD, TaskType.DOWNLOAD, TaskType.DELETE
+
+
+@lru_cache(maxsize=1)
+def _task_type_map():
+    """Return the task type menu choice -> TaskType mapping"""
+    return dict(zip(('1', '2', '3'), _task_types()))
+
+
+def _progress_printer():
+    """
+    Build a transfer progress callback that redraws the progress line
+
+    The handler already rate limits progress updates, so every call draws.
+    """
+    def progress_callback(transferred, total):
+        percent = int(transferred * 100 / total) if total else 100
+        sys.stdout.write(f"\rProgress: {percent}% ({transferred}/{total} bytes)")
+        sys.stdout.flush()
+    
+    return progress_callback
 
 
 class ConsoleInterface:
     """Console-based interface for WinSCP Manager"""
     
+    # Menu choice -> method name, resolved on the instance only when selected
+    _ACTION_NAMES = {
+        '1': 'connect',
+        '2': 'disconnect',
+        '3': 'upload_file',
+        '4': 'download_file',
+        '5': 'delete_file',
+        '6': 'list_files',
+        '7': 'schedule_task',
+        '8': 'view_tasks',
+        '9': 'remove_task',
+        '10': 'start_scheduler',
+        '11': 'stop_scheduler',
+        '12': 'exit_app'
+    }
+    
     def __init__(self):
         """Initialize console interface"""
         self.config_manager = None
@@ -25,35 +107,33 @@ class ConsoleInterface:
         self.connected = False
         self.running = True
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        # Setup logging (once per process; later instances reuse the root handlers)
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s'
+            )
         self.logger = logging.getLogger(__name__)
     
     def run(self):
         """Run the console interface"""
-        print("=" * 60)
-        print("WinSCP Manager - Console Interface")
-        print("=" * 60)
-        print()
+        sys.stdout.write("\n".join(["=" * 60, "WinSCP Manager - Console Interface", "=" * 60, "", ""]))
         
         # Try to load config
         try:
-            self.config_manager = ConfigManager()
+            self.config_manager = get_config_manager()
             self.logger.info("Configuration loaded successfully")
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {str(e)}")
+            self.logger.error("Failed to load configuration: %s", e)
             print("Warning: Could not load configuration file")
         
         # Initialize scheduler
         try:
-            self.scheduler = TaskScheduler()
+            self.scheduler = _sched_mod().TaskScheduler()
             self.scheduler.set_task_executor(self.execute_scheduled_task)
             self.logger.info("Scheduler initialized")
         except Exception as e:
-            self.logger.error(f"Failed to initialize scheduler: {str(e)}")
+            self.logger.error("Failed to initialize scheduler: %s", e)
         
         while self.running:
             self.show_menu()
@@ -62,49 +142,30 @@ class ConsoleInterface:
     
     def show_menu(self):
         """Display main menu"""
-        print("\n" + "=" * 60)
-        print("Main Menu")
-        print("=" * 60)
-        print("1. Connect to server")
-        print("2. Disconnect from server")
-        print("3. Upload file")
-        print("4. Download file")
-        print("5. Delete file")
-        print("6. List remote files")
-        print("7. Schedule task")
-        print("8. View scheduled tasks")
-        print("9. Remove scheduled task")
-        print("10. Start scheduler")
-        print("11. Stop scheduler")
-        print("12. Exit")
-        print("=" * 60)
+        print(_MENU)
     
     def handle_choice(self, choice: str):
         """Handle menu choice"""
-        actions = {
-            '1': self.connect,
-            '2': self.disconnect,
-            '3': self.upload_file,
-            '4': self.download_file,
-            '5': self.delete_file,
-            '6': self.list_files,
-            '7': self.schedule_task,
-            '8': self.view_tasks,
-            '9': self.remove_task,
-            '10': self.start_scheduler,
-            '11': self.stop_scheduler,
-            '12': self.exit_app
-        }
-        
-        action = actions.get(choice)
-        if action:
-            try:
-                action()
-            except Exception as e:
-                self.logger.error(f"Error: {str(e)}")
-                print(f"\nError: {str(e)}")
-        else:
+        name = self._ACTION_NAMES.get(choice)
+        if name is None:
             print("\nInvalid choice. Please try again.")
+            return
+        
+        try:
+            getattr(self, name)()
+        except Exception as e:
+            self.logger.error("Error: %s", e)
+            print(f"\nError: {str(e)}")
+    
+    def _connection_details(self):
+        """
+        Return connection details from the shared config manager
+        
+        Read on every call: the manager caches them and re-reads config.ini
+        when it changes, so scheduled tasks see edits without a reconnect.
+        """
+        config_manager = self.config_manager or get_config_manager()
+        return config_manager.get_connection_details()
     
     def connect(self):
         """Connect to server"""
@@ -117,11 +178,11 @@ class ConsoleInterface:
             return
         
         try:
-            conn_details = self.config_manager.get_connection_details()
+            conn_details = self._connection_details()
             
             print(f"\nConnecting to {conn_details['host']}:{conn_details['port']}...")
             
-            self.winscp_handler = WinSCPHandler(
+            self.winscp_handler = _handler_cls()(
                 host=conn_details['host'],
                 port=conn_details['port'],
                 username=conn_details['username'],
@@ -163,9 +224,7 @@ class ConsoleInterface:
         
         print(f"\nUploading {local_path} to {remote_path}...")
         
-        def progress_callback(sent, total):
-            progress = (sent / total) * 100
-            print(f"\rProgress: {progress:.1f}% ({sent}/{total} bytes)", end='', flush=True)
+        progress_callback = _progress_printer()
         
         if self.winscp_handler.upload_file(local_path, remote_path, progress_callback):
             print("\n✓ Upload completed successfully")
@@ -187,9 +246,7 @@ class ConsoleInterface:
         
         print(f"\nDownloading {remote_path} to {local_path}...")
         
-        def progress_callback(received, total):
-            progress = (received / total) * 100
-            print(f"\rProgress: {progress:.1f}% ({received}/{total} bytes)", end='', flush=True)
+        progress_callback = _progress_printer()
         
         if self.winscp_handler.download_file(remote_path, local_path, progress_callback):
             print("\n✓ Download completed successfully")
@@ -229,11 +286,10 @@ class ConsoleInterface:
         files = self.winscp_handler.list_files(remote_path)
         
         if files:
-            print(f"\nFiles in {remote_path}:")
-            print("-" * 60)
-            for file in files:
-                print(f"  {file}")
-            print("-" * 60)
+            lines = [f"\nFiles in {remote_path}:", "-" * 60]
+            lines.extend(f"  {file}" for file in files)
+            lines.append("-" * 60)
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("\nNo files found or error occurred")
     
@@ -243,13 +299,13 @@ class ConsoleInterface:
             print("\n✗ Scheduler not initialized")
             return
         
-        print("\nSchedule New Task")
-        print("-" * 60)
-        print("Task Types: 1) Upload  2) Download  3) Delete")
+        sys.stdout.write("\n".join(["\nSchedule New Task", "-" * 60,
+                                    "Task Types: 1) Upload  2) Download  3) Delete", ""]))
         task_choice = input("Select task type (1-3): ").strip()
         
-        task_type_map = {'1': TaskType.UPLOAD, '2': TaskType.DOWNLOAD, '3': TaskType.DELETE}
-        task_type = task_type_map.get(task_choice)
+        sched = _sched_mod()
+        upload, download, _ = _task_types()
+        task_type = _task_type_map().get(task_choice)
         
         if not task_type:
             print("✗ Invalid task type")
@@ -258,7 +314,7 @@ class ConsoleInterface:
         source_path = input("Enter source path: ").strip()
         dest_path = ""
         
-        if task_type in [TaskType.UPLOAD, TaskType.DOWNLOAD]:
+        if task_type is upload or task_type is download:
             dest_path = input("Enter destination path: ").strip()
         
         delay_minutes = int(input("Run in how many minutes? ").strip() or "5")
@@ -269,10 +325,10 @@ class ConsoleInterface:
         if recurring:
             interval_minutes = int(input("Interval in minutes: ").strip() or "60")
         
-        task_id = str(uuid.uuid4())
+        task_id = os.urandom(16).hex()
         scheduled_time = datetime.now() + timedelta(minutes=delay_minutes)
         
-        task = ScheduledTask(
+        task = sched.ScheduledTask(
             task_id=task_id,
             task_type=task_type,
             source_path=source_path,
@@ -283,8 +339,8 @@ class ConsoleInterface:
         )
         
         self.scheduler.add_task(task)
-        print(f"\n✓ Task scheduled successfully (ID: {task_id[:8]}...)")
-        print(f"  Will run at: {scheduled_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        sys.stdout.write(f"\n✓ Task scheduled successfully (ID: {task_id[:8]}...)\n"
+                         f"  Will run at: {scheduled_time.strftime(_TIME_FORMAT)}\n")
     
     def view_tasks(self):
         """View all scheduled tasks"""
@@ -298,20 +354,22 @@ class ConsoleInterface:
             print("\nNo scheduled tasks")
             return
         
-        print("\nScheduled Tasks")
-        print("=" * 80)
+        lines = ["\nScheduled Tasks", "=" * 80]
         
         for task in tasks:
-            print(f"\nTask ID: {task.task_id}")
-            print(f"Type: {task.task_type.value}")
-            print(f"Source: {task.source_path}")
-            print(f"Destination: {task.dest_path if task.dest_path else 'N/A'}")
-            print(f"Next Run: {task.next_run.strftime('%Y-%m-%d %H:%M:%S') if task.next_run else 'N/A'}")
-            print(f"Status: {task.status.value}")
-            print(f"Recurring: {'Yes' if task.recurring else 'No'}")
+            next_run = task.next_run.strftime(_TIME_FORMAT) if task.next_run else 'N/A'
+            lines.append(f"\nTask ID: {task.task_id}")
+            lines.append(f"Type: {task.task_type.value}")
+            lines.append(f"Source: {task.source_path}")
+            lines.append(f"Destination: {task.dest_path if task.dest_path else 'N/A'}")
+            lines.append(f"Next Run: {next_run}")
+            lines.append(f"Status: {task.status.value}")
+            lines.append(f"Recurring: {'Yes' if task.recurring else 'No'}")
             if task.recurring:
-                print(f"Interval: {task.interval_minutes} minutes")
-            print("-" * 80)
+                lines.append(f"Interval: {task.interval_minutes} minutes")
+            lines.append("-" * 80)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def remove_task(self):
         """Remove a scheduled task"""
@@ -322,15 +380,15 @@ class ConsoleInterface:
         task_id = input("\nEnter task ID to remove: ").strip()
         
         # Try to find task by full ID or partial ID
-        for task in self.scheduler.get_all_tasks():
-            if task.task_id == task_id or task.task_id.startswith(task_id):
-                if self.scheduler.remove_task(task.task_id):
-                    print(f"✓ Task {task.task_id[:8]}... removed")
-                else:
-                    print("✗ Failed to remove task")
-                return
-        
-        print("✗ Task not found")
+        full_id = self.scheduler.find_task_by_prefix(task_id)
+        if full_id is None:
+            print("✗ Task not found")
+            return
+        
+        if self.scheduler.remove_task(full_id):
+            print(f"✓ Task {full_id[:8]}... removed")
+        else:
+            print("✗ Failed to remove task")
     
     def start_scheduler(self):
         """Start the scheduler"""
@@ -358,37 +416,40 @@ class ConsoleInterface:
         self.scheduler.stop()
         print("\n✓ Scheduler stopped")
     
-    def execute_scheduled_task(self, task: ScheduledTask) -> bool:
+    def execute_scheduled_task(self, task: 'ScheduledTask') -> bool:
         """Execute a scheduled task"""
+        upload, download, delete = _task_types()
         try:
-            # Ensure connection
-            if not self.connected:
-                self.logger.info("Attempting to connect for scheduled task...")
-                if not self.winscp_handler:
-                    conn_details = self.config_manager.get_connection_details()
-                    self.winscp_handler = WinSCPHandler(
-                        conn_details['host'],
-                        conn_details['port'],
-                        conn_details['username'],
-                        conn_details['password']
-                    )
-                
-                if not self.winscp_handler.connect():
-                    self.logger.error("Failed to connect for scheduled task")
-                    return False
-                self.connected = True
-            
-            # Execute task based on type
-            if task.task_type == TaskType.UPLOAD:
-                return self.winscp_handler.upload_file(task.source_path, task.dest_path)
-            elif task.task_type == TaskType.DOWNLOAD:
-                return self.winscp_handler.download_file(task.source_path, task.dest_path)
-            elif task.task_type == TaskType.DELETE:
-                return self.winscp_handler.delete_file(task.source_path)
+            # Each task borrows a pooled connection, so concurrent tasks don't
+            # share one SFTP channel and back-to-back tasks skip the handshake
+            conn_details = self._connection_details()
+            handler = _handler_cls().acquire(
+                conn_details['host'],
+                conn_details['port'],
+                conn_details['username'],
+                conn_details['password'],
+                conn_details['private_key_path'],
+                conn_details['protocol']
+            )
+            if handler is None:
+                self.logger.error("Failed to connect for scheduled task")
+                return False
             
-            return False
+            try:
+                # Execute task based on type
+                task_type = task.task_type
+                if task_type is upload:
+                    return handler.upload_file(task.source_path, task.dest_path)
+                elif task_type is download:
+                    return handler.download_file(task.source_path, task.dest_path)
+                elif task_type is delete:
+                    return handler.delete_file(task.source_path)
+                
+                return False
+            finally:
+                handler.release()
         except Exception as e:
-            self.logger.error(f"Task execution error: {str(e)}")
+            self.logger.error("Task execution error: %s", e)
             return False
     
     def exit_app(self):
@@ -402,6 +463,9 @@ class ConsoleInterface:
         # Disconnect if connected
         if self.connected:
             self.winscp_handler.disconnect()
+        # Only if the handler module was ever imported
+        if _handler_cls.cache_info().currsize:
+            _handler_cls().close_pool()
         
         self.running = False
         print("Goodbye!")
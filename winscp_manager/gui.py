@@ -5,19 +5,40 @@ GUI Interface for WinSCP Manager using tkinter
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from datetime import datetime, timedelta
+import collections
 import threading
 import logging
 from typing import Optional
 import uuid
 
-from .config_manager import ConfigManager
+from .config_manager import get_config_manager
 from .winscp_handler import WinSCPHandler
 from .scheduler import TaskScheduler, ScheduledTask, TaskType, TaskStatus
 
 
+# Shared form layout: LabelFrame padding, entry widths for form fields and
+# file paths, and the narrower width that lines comboboxes/spinboxes (which
+# draw an arrow button) up with form entries
+_FRAME_PADDING = 10
+_FORM_WIDTH = 40
+_PATH_WIDTH = 50
+_SELECT_WIDTH = 37
+
+# Upper bound offered by the scheduler minute spinboxes (one year)
+_MAX_MINUTES = 525600
+
+
+def _format_next_run(value: datetime) -> str:
+    """Format a task time as YYYY-MM-DD HH:MM without strftime"""
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d} {value.hour:02d}:{value.minute:02d}"
+
+
 class WinSCPManagerGUI:
     """Main GUI application"""
     
+    # Root logger handler shared by every GUI instance in the process
+    _text_handler = None
+    
     def __init__(self, root: tk.Tk):
         """
         Initialize GUI
@@ -34,9 +55,17 @@ class WinSCPManagerGUI:
         self.winscp_handler = None
         self.scheduler = None
         self.connected = False
+        self._last_task_rows = None
+        self._pending_task_rows = None
         
         # Setup logging
         self.setup_logging()
+        self._log_dispatch = {
+            'INFO': self.logger.info,
+            'WARNING': self.logger.warning,
+            'ERROR': self.logger.error
+        }
+        self._log_default = self.logger.info
         
         # Create GUI
         self.create_widgets()
@@ -48,56 +77,94 @@ class WinSCPManagerGUI:
         """Setup logging configuration"""
         self.logger = logging.getLogger(__name__)
         
+        # One text handler per process. It buffers records until the Logs
+        # tab is built and attaches its widget.
+        if WinSCPManagerGUI._text_handler is None:
+            text_handler = TextHandler()
+            text_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            logging.getLogger().addHandler(text_handler)
+            WinSCPManagerGUI._text_handler = text_handler
+        else:
+            WinSCPManagerGUI._text_handler.attach(None)
+        logging.getLogger().setLevel(logging.INFO)
+        
     def create_widgets(self):
         """Create GUI widgets"""
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True, padx=5, pady=5)
         
-        # Create tabs
-        self.create_connection_tab()
-        self.create_file_operations_tab()
-        self.create_scheduler_tab()
-        self.create_log_tab()
+        # Create tab frames; their widgets are built the first time each
+        # tab is shown (the connection tab is visible at startup)
+        self._tab_builders = {}
+        self._tab_built = set()
+        for text, builder in (("Connection", self.create_connection_tab),
+                              ("File Operations", self.create_file_operations_tab),
+                              ("Scheduler", self.create_scheduler_tab),
+                              ("Logs", self.create_log_tab)):
+            tab = ttk.Frame(self.notebook)
+            self.notebook.add(tab, text=text)
+            self._tab_builders[str(tab)] = builder
+        
+        self._build_tab(self.notebook.tabs()[0])
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Status bar
         self.status_bar = tk.Label(self.root, text="Disconnected", bd=1, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
-    def create_connection_tab(self):
-        """Create connection settings tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Connection")
+    def _build_tab(self, tab_id: str):
+        """Build a notebook tab's widgets unless already built"""
+        if tab_id in self._tab_built:
+            return
+        self._tab_built.add(tab_id)
+        self._tab_builders[tab_id](self.notebook.nametowidget(tab_id))
+    
+    def _on_tab_changed(self, event):
+        """Build the newly selected tab on first view"""
+        self._build_tab(self.notebook.select())
+    
+    def create_connection_tab(self, tab):
+        """
+        Create connection settings tab
         
+        Args:
+            tab: Notebook frame to build the tab in
+        """
         # Connection frame
-        conn_frame = ttk.LabelFrame(tab, text="Connection Settings", padding=10)
+        conn_frame = ttk.LabelFrame(tab, text="Connection Settings", padding=_FRAME_PADDING)
         conn_frame.pack(fill='x', padx=10, pady=10)
         
         # Host
         ttk.Label(conn_frame, text="Host:").grid(row=0, column=0, sticky='w', pady=5)
-        self.host_entry = ttk.Entry(conn_frame, width=40)
+        self.host_var = tk.StringVar()
+        self.host_entry = ttk.Entry(conn_frame, textvariable=self.host_var, width=_FORM_WIDTH)
         self.host_entry.grid(row=0, column=1, padx=5, pady=5)
         
         # Port
         ttk.Label(conn_frame, text="Port:").grid(row=1, column=0, sticky='w', pady=5)
-        self.port_entry = ttk.Entry(conn_frame, width=40)
+        self.port_var = tk.IntVar(value=22)
+        self.port_entry = ttk.Spinbox(conn_frame, from_=1, to=65535, increment=1,
+                                      textvariable=self.port_var, width=_SELECT_WIDTH)
         self.port_entry.grid(row=1, column=1, padx=5, pady=5)
         
         # Username
         ttk.Label(conn_frame, text="Username:").grid(row=2, column=0, sticky='w', pady=5)
-        self.username_entry = ttk.Entry(conn_frame, width=40)
+        self.username_var = tk.StringVar()
+        self.username_entry = ttk.Entry(conn_frame, textvariable=self.username_var, width=_FORM_WIDTH)
         self.username_entry.grid(row=2, column=1, padx=5, pady=5)
         
         # Password
         ttk.Label(conn_frame, text="Password:").grid(row=3, column=0, sticky='w', pady=5)
-        self.password_entry = ttk.Entry(conn_frame, width=40, show="*")
+        self.password_var = tk.StringVar()
+        self.password_entry = ttk.Entry(conn_frame, textvariable=self.password_var, width=_FORM_WIDTH, show="*")
         self.password_entry.grid(row=3, column=1, padx=5, pady=5)
         
         # Protocol
         ttk.Label(conn_frame, text="Protocol:").grid(row=4, column=0, sticky='w', pady=5)
         self.protocol_var = tk.StringVar(value="sftp")
         protocol_combo = ttk.Combobox(conn_frame, textvariable=self.protocol_var, 
-                                      values=["sftp", "scp"], state="readonly", width=37)
+                                      values=["sftp", "scp"], state="readonly", width=_SELECT_WIDTH)
         protocol_combo.grid(row=4, column=1, padx=5, pady=5)
         
         # Buttons
@@ -111,39 +178,42 @@ class WinSCPManagerGUI:
                                         command=self.disconnect, state='disabled')
         self.disconnect_btn.pack(side='left', padx=5)
         
-        ttk.Button(btn_frame, text="Load Config", command=self.load_configuration).pack(side='left', padx=5)
+        ttk.Button(btn_frame, text="Load Config",
+                  command=lambda: self.load_configuration(reload=True)).pack(side='left', padx=5)
     
-    def create_file_operations_tab(self):
-        """Create file operations tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="File Operations")
+    def create_file_operations_tab(self, tab):
+        """
+        Create file operations tab
         
+        Args:
+            tab: Notebook frame to build the tab in
+        """
         # Upload frame
-        upload_frame = ttk.LabelFrame(tab, text="Upload File", padding=10)
+        upload_frame = ttk.LabelFrame(tab, text="Upload File", padding=_FRAME_PADDING)
         upload_frame.pack(fill='x', padx=10, pady=10)
         
         ttk.Label(upload_frame, text="Local File:").grid(row=0, column=0, sticky='w', pady=5)
-        self.upload_local_entry = ttk.Entry(upload_frame, width=50)
+        self.upload_local_entry = ttk.Entry(upload_frame, width=_PATH_WIDTH)
         self.upload_local_entry.grid(row=0, column=1, padx=5, pady=5)
         ttk.Button(upload_frame, text="Browse", 
                   command=lambda: self.browse_file(self.upload_local_entry)).grid(row=0, column=2, padx=5)
         
         ttk.Label(upload_frame, text="Remote Path:").grid(row=1, column=0, sticky='w', pady=5)
-        self.upload_remote_entry = ttk.Entry(upload_frame, width=50)
+        self.upload_remote_entry = ttk.Entry(upload_frame, width=_PATH_WIDTH)
         self.upload_remote_entry.grid(row=1, column=1, padx=5, pady=5)
         
         ttk.Button(upload_frame, text="Upload", command=self.upload_file).grid(row=2, column=1, pady=10)
         
         # Download frame
-        download_frame = ttk.LabelFrame(tab, text="Download File", padding=10)
+        download_frame = ttk.LabelFrame(tab, text="Download File", padding=_FRAME_PADDING)
         download_frame.pack(fill='x', padx=10, pady=10)
         
         ttk.Label(download_frame, text="Remote Path:").grid(row=0, column=0, sticky='w', pady=5)
-        self.download_remote_entry = ttk.Entry(download_frame, width=50)
+        self.download_remote_entry = ttk.Entry(download_frame, width=_PATH_WIDTH)
         self.download_remote_entry.grid(row=0, column=1, padx=5, pady=5)
         
         ttk.Label(download_frame, text="Local File:").grid(row=1, column=0, sticky='w', pady=5)
-        self.download_local_entry = ttk.Entry(download_frame, width=50)
+        self.download_local_entry = ttk.Entry(download_frame, width=_PATH_WIDTH)
         self.download_local_entry.grid(row=1, column=1, padx=5, pady=5)
         ttk.Button(download_frame, text="Browse", 
                   command=lambda: self.browse_save_file(self.download_local_entry)).grid(row=1, column=2, padx=5)
@@ -151,11 +221,11 @@ class WinSCPManagerGUI:
         ttk.Button(download_frame, text="Download", command=self.download_file).grid(row=2, column=1, pady=10)
         
         # Delete frame
-        delete_frame = ttk.LabelFrame(tab, text="Delete File", padding=10)
+        delete_frame = ttk.LabelFrame(tab, text="Delete File", padding=_FRAME_PADDING)
         delete_frame.pack(fill='x', padx=10, pady=10)
         
         ttk.Label(delete_frame, text="Remote Path:").grid(row=0, column=0, sticky='w', pady=5)
-        self.delete_remote_entry = ttk.Entry(delete_frame, width=50)
+        self.delete_remote_entry = ttk.Entry(delete_frame, width=_PATH_WIDTH)
         self.delete_remote_entry.grid(row=0, column=1, padx=5, pady=5)
         
         ttk.Button(delete_frame, text="Delete", command=self.delete_file).grid(row=1, column=1, pady=10)
@@ -168,13 +238,15 @@ class WinSCPManagerGUI:
         self.progress_label = ttk.Label(tab, text="")
         self.progress_label.pack()
     
-    def create_scheduler_tab(self):
-        """Create scheduler tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Scheduler")
+    def create_scheduler_tab(self, tab):
+        """
+        Create scheduler tab
         
+        Args:
+            tab: Notebook frame to build the tab in
+        """
         # Add task frame
-        add_frame = ttk.LabelFrame(tab, text="Add Scheduled Task", padding=10)
+        add_frame = ttk.LabelFrame(tab, text="Add Scheduled Task", padding=_FRAME_PADDING)
         add_frame.pack(fill='x', padx=10, pady=10)
         
         # Task type
@@ -182,25 +254,26 @@ class WinSCPManagerGUI:
         self.task_type_var = tk.StringVar(value="upload")
         task_type_combo = ttk.Combobox(add_frame, textvariable=self.task_type_var,
                                        values=["upload", "download", "delete"], 
-                                       state="readonly", width=37)
+                                       state="readonly", width=_SELECT_WIDTH)
         task_type_combo.grid(row=0, column=1, padx=5, pady=5)
         
         # Source path
         ttk.Label(add_frame, text="Source Path:").grid(row=1, column=0, sticky='w', pady=5)
-        self.task_source_entry = ttk.Entry(add_frame, width=40)
+        self.task_source_entry = ttk.Entry(add_frame, width=_FORM_WIDTH)
         self.task_source_entry.grid(row=1, column=1, padx=5, pady=5)
         ttk.Button(add_frame, text="Browse", 
                   command=lambda: self.browse_file(self.task_source_entry)).grid(row=1, column=2, padx=5)
         
         # Destination path
         ttk.Label(add_frame, text="Dest Path:").grid(row=2, column=0, sticky='w', pady=5)
-        self.task_dest_entry = ttk.Entry(add_frame, width=40)
+        self.task_dest_entry = ttk.Entry(add_frame, width=_FORM_WIDTH)
         self.task_dest_entry.grid(row=2, column=1, padx=5, pady=5)
         
         # Schedule time
         ttk.Label(add_frame, text="Run In (minutes):").grid(row=3, column=0, sticky='w', pady=5)
-        self.task_delay_entry = ttk.Entry(add_frame, width=40)
-        self.task_delay_entry.insert(0, "5")
+        self.task_delay_var = tk.IntVar(value=5)
+        self.task_delay_entry = ttk.Spinbox(add_frame, from_=0, to=_MAX_MINUTES, increment=1,
+                                            textvariable=self.task_delay_var, width=_SELECT_WIDTH)
         self.task_delay_entry.grid(row=3, column=1, padx=5, pady=5)
         
         # Recurring
@@ -210,14 +283,15 @@ class WinSCPManagerGUI:
         
         # Interval
         ttk.Label(add_frame, text="Interval (minutes):").grid(row=5, column=0, sticky='w', pady=5)
-        self.task_interval_entry = ttk.Entry(add_frame, width=40)
-        self.task_interval_entry.insert(0, "60")
+        self.task_interval_var = tk.IntVar(value=60)
+        self.task_interval_entry = ttk.Spinbox(add_frame, from_=1, to=_MAX_MINUTES, increment=1,
+                                               textvariable=self.task_interval_var, width=_SELECT_WIDTH)
         self.task_interval_entry.grid(row=5, column=1, padx=5, pady=5)
         
         ttk.Button(add_frame, text="Add Task", command=self.add_scheduled_task).grid(row=6, column=1, pady=10)
         
         # Tasks list
-        list_frame = ttk.LabelFrame(tab, text="Scheduled Tasks", padding=10)
+        list_frame = ttk.LabelFrame(tab, text="Scheduled Tasks", padding=_FRAME_PADDING)
         list_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Create treeview
@@ -231,9 +305,9 @@ class WinSCPManagerGUI:
         self.tasks_tree.pack(fill='both', expand=True)
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.tasks_tree.yview)
-        scrollbar.pack(side='right', fill='y')
-        self.tasks_tree.configure(yscrollcommand=scrollbar.set)
+        self.tasks_scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.tasks_tree.yview)
+        self.tasks_scrollbar.pack(side='right', fill='y')
+        self.tasks_tree.configure(yscrollcommand=self.tasks_scrollbar.set)
         
         # Buttons
         btn_frame = ttk.Frame(list_frame)
@@ -252,19 +326,18 @@ class WinSCPManagerGUI:
         self.scheduler_status_label = ttk.Label(control_frame, text="Scheduler: Stopped")
         self.scheduler_status_label.pack(side='left', padx=5)
     
-    def create_log_tab(self):
-        """Create log viewer tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Logs")
+    def create_log_tab(self, tab):
+        """
+        Create log viewer tab
         
+        Args:
+            tab: Notebook frame to build the tab in
+        """
         self.log_text = scrolledtext.ScrolledText(tab, wrap=tk.WORD, height=30)
         self.log_text.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # Configure text handler for logging
-        text_handler = TextHandler(self.log_text)
-        text_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        logging.getLogger().addHandler(text_handler)
-        logging.getLogger().setLevel(logging.INFO)
+        # Show records logged so far and everything from now on
+        WinSCPManagerGUI._text_handler.attach(self.log_text)
     
     def browse_file(self, entry_widget):
         """Browse for file"""
@@ -280,29 +353,34 @@ class WinSCPManagerGUI:
             entry_widget.delete(0, tk.END)
             entry_widget.insert(0, filename)
     
-    def load_configuration(self):
-        """Load configuration from file"""
+    def load_configuration(self, reload: bool = False):
+        """
+        Load configuration from file
+        
+        The shared config manager caches settings until config.ini changes
+        on disk, so repeated loads do not re-parse the file.
+        
+        Args:
+            reload: Rebuild the cached settings first (explicit user request)
+        """
         try:
-            self.config_manager = ConfigManager()
+            self.config_manager = get_config_manager()
+            if reload:
+                # Explicit refresh: re-read the file even if it looks unchanged
+                self.config_manager.load_config(force=True)
             conn_details = self.config_manager.get_connection_details()
             
-            self.host_entry.delete(0, tk.END)
-            self.host_entry.insert(0, conn_details.get('host', ''))
-            
-            self.port_entry.delete(0, tk.END)
-            self.port_entry.insert(0, str(conn_details.get('port', 22)))
-            
-            self.username_entry.delete(0, tk.END)
-            self.username_entry.insert(0, conn_details.get('username', ''))
-            
-            self.password_entry.delete(0, tk.END)
-            self.password_entry.insert(0, conn_details.get('password', ''))
-            
+            self.host_var.set(conn_details.get('host', ''))
+            self.port_var.set(conn_details.get('port', 22))
+            self.username_var.set(conn_details.get('username', ''))
+            self.password_var.set(conn_details.get('password', ''))
             self.protocol_var.set(conn_details.get('protocol', 'sftp'))
             
-            # Initialize scheduler
-            self.scheduler = TaskScheduler()
-            self.scheduler.set_task_executor(self.execute_scheduled_task)
+            # Initialize scheduler once; a second instance on the same tasks
+            # file would hold a stale copy of the task table
+            if not self.scheduler:
+                self.scheduler = TaskScheduler()
+                self.scheduler.set_task_executor(self.execute_scheduled_task)
             
             self.log("Configuration loaded successfully")
         except Exception as e:
@@ -311,32 +389,54 @@ class WinSCPManagerGUI:
     def connect(self):
         """Connect to remote server"""
         try:
-            host = self.host_entry.get()
-            port = int(self.port_entry.get())
-            username = self.username_entry.get()
-            password = self.password_entry.get()
+            host = self.host_var.get()
+            port = self.port_var.get()
+            username = self.username_var.get()
+            password = self.password_var.get()
             protocol = self.protocol_var.get()
-            
-            if not host or not username:
-                messagebox.showerror("Error", "Host and username are required")
-                return
-            
-            self.log(f"Connecting to {host}:{port}...")
-            
-            self.winscp_handler = WinSCPHandler(host, port, username, password, '', protocol)
-            
-            if self.winscp_handler.connect():
-                self.connected = True
-                self.connect_btn.config(state='disabled')
-                self.disconnect_btn.config(state='normal')
-                self.status_bar.config(text=f"Connected to {host}:{port}")
-                self.log("Connection successful")
-                messagebox.showinfo("Success", "Connected successfully!")
-            else:
-                messagebox.showerror("Error", "Connection failed")
         except Exception as e:
             self.log(f"Connection error: {str(e)}", "ERROR")
             messagebox.showerror("Error", f"Connection failed: {str(e)}")
+            return
+        
+        if not host or not username:
+            messagebox.showerror("Error", "Host and username are required")
+            return
+        
+        self.log(f"Connecting to {host}:{port}...")
+        self.connect_btn.config(state='disabled')
+        
+        def connect_thread():
+            handler = None
+            error = None
+            success = False
+            try:
+                handler = WinSCPHandler(host, port, username, password, '', protocol)
+                success = handler.connect()
+            except Exception as e:
+                error = e
+            self.root.after(0, self._on_connect_done, handler, success, error, host, port)
+        
+        threading.Thread(target=connect_thread, daemon=True).start()
+    
+    def _on_connect_done(self, handler, success: bool, error, host: str, port: int):
+        """Update the UI once a connection attempt finishes (Tk main thread)"""
+        if error is not None:
+            self.connect_btn.config(state='normal')
+            self.log(f"Connection error: {str(error)}", "ERROR")
+            messagebox.showerror("Error", f"Connection failed: {str(error)}")
+            return
+        
+        if success:
+            self.winscp_handler = handler
+            self.connected = True
+            self.disconnect_btn.config(state='normal')
+            self.status_bar.config(text=f"Connected to {host}:{port}")
+            self.log("Connection successful")
+            messagebox.showinfo("Success", "Connected successfully!")
+        else:
+            self.connect_btn.config(state='normal')
+            messagebox.showerror("Error", "Connection failed")
     
     def disconnect(self):
         """Disconnect from server"""
@@ -364,19 +464,13 @@ class WinSCPManagerGUI:
         def upload_thread():
             self.log(f"Uploading {local_path} to {remote_path}...")
             
-            def progress_callback(sent, total):
-                progress = (sent / total) * 100
-                self.progress_var.set(progress)
-                self.progress_label.config(text=f"Uploading: {sent}/{total} bytes ({progress:.1f}%)")
+            progress_callback = self._progress_callback("Uploading")
             
             if self.winscp_handler.upload_file(local_path, remote_path, progress_callback):
                 self.log("Upload completed successfully")
-                messagebox.showinfo("Success", "File uploaded successfully!")
+                self.root.after(0, self._finish_transfer, True, "File uploaded successfully!")
             else:
-                messagebox.showerror("Error", "Upload failed")
-            
-            self.progress_var.set(0)
-            self.progress_label.config(text="")
+                self.root.after(0, self._finish_transfer, False, "Upload failed")
         
         threading.Thread(target=upload_thread, daemon=True).start()
     
@@ -396,22 +490,50 @@ class WinSCPManagerGUI:
         def download_thread():
             self.log(f"Downloading {remote_path} to {local_path}...")
             
-            def progress_callback(received, total):
-                progress = (received / total) * 100
-                self.progress_var.set(progress)
-                self.progress_label.config(text=f"Downloading: {received}/{total} bytes ({progress:.1f}%)")
+            progress_callback = self._progress_callback("Downloading")
             
             if self.winscp_handler.download_file(remote_path, local_path, progress_callback):
                 self.log("Download completed successfully")
-                messagebox.showinfo("Success", "File downloaded successfully!")
+                self.root.after(0, self._finish_transfer, True, "File downloaded successfully!")
             else:
-                messagebox.showerror("Error", "Download failed")
-            
-            self.progress_var.set(0)
-            self.progress_label.config(text="")
+                self.root.after(0, self._finish_transfer, False, "Download failed")
         
         threading.Thread(target=download_thread, daemon=True).start()
     
+    def _finish_transfer(self, success: bool, message: str):
+        """Report a finished transfer and reset the progress bar (Tk main thread)"""
+        if success:
+            messagebox.showinfo("Success", message)
+        else:
+            messagebox.showerror("Error", message)
+        self._reset_progress()
+    
+    def _reset_progress(self):
+        """Clear the progress bar and label"""
+        self.progress_var.set(0)
+        self.progress_label.config(text="")
+    
+    def _progress_callback(self, action: str):
+        """
+        Build a transfer progress callback for a worker thread
+        
+        The handler already rate limits updates; each one is handed to the
+        Tk main loop with root.after, so the worker never touches widgets.
+        
+        Args:
+            action: Verb shown in the progress label
+        """
+        def progress_callback(transferred, total):
+            self.root.after(0, self._apply_progress, action, transferred, total)
+        
+        return progress_callback
+    
+    def _apply_progress(self, action: str, transferred: int, total: int):
+        """Show transfer progress (runs on the Tk main thread)"""
+        progress = (transferred / total) * 100 if total else 100.0
+        self.progress_var.set(progress)
+        self.progress_label.config(text=f"{action}: {transferred}/{total} bytes ({progress:.1f}%)")
+    
     def delete_file(self):
         """Delete remote file"""
         if not self.connected:
@@ -424,12 +546,22 @@ class WinSCPManagerGUI:
             messagebox.showerror("Error", "Remote path is required")
             return
         
-        if messagebox.askyesno("Confirm", f"Delete {remote_path}?"):
-            if self.winscp_handler.delete_file(remote_path):
-                self.log(f"Deleted {remote_path}")
-                messagebox.showinfo("Success", "File deleted successfully!")
-            else:
-                messagebox.showerror("Error", "Delete failed")
+        if not messagebox.askyesno("Confirm", f"Delete {remote_path}?"):
+            return
+        
+        def delete_thread():
+            success = self.winscp_handler.delete_file(remote_path)
+            self.root.after(0, self._on_delete_done, remote_path, success)
+        
+        threading.Thread(target=delete_thread, daemon=True).start()
+    
+    def _on_delete_done(self, remote_path: str, success: bool):
+        """Report the result of a delete (Tk main thread)"""
+        if success:
+            self.log(f"Deleted {remote_path}")
+            messagebox.showinfo("Success", "File deleted successfully!")
+        else:
+            messagebox.showerror("Error", "Delete failed")
     
     def add_scheduled_task(self):
         """Add a new scheduled task"""
@@ -437,9 +569,9 @@ class WinSCPManagerGUI:
             task_type = TaskType(self.task_type_var.get())
             source_path = self.task_source_entry.get()
             dest_path = self.task_dest_entry.get()
-            delay_minutes = int(self.task_delay_entry.get())
+            delay_minutes = self.task_delay_var.get()
             recurring = self.recurring_var.get()
-            interval_minutes = int(self.task_interval_entry.get()) if recurring else 0
+            interval_minutes = self.task_interval_var.get() if recurring else 0
             
             if not source_path:
                 messagebox.showerror("Error", "Source path is required")
@@ -474,56 +606,93 @@ class WinSCPManagerGUI:
     def execute_scheduled_task(self, task: ScheduledTask) -> bool:
         """Execute a scheduled task"""
         try:
-            # Ensure connection
-            if not self.connected:
-                self.log("Attempting to connect for scheduled task...")
-                # Try to connect using saved config
-                if not self.winscp_handler:
-                    conn_details = self.config_manager.get_connection_details()
-                    self.winscp_handler = WinSCPHandler(
-                        conn_details['host'],
-                        conn_details['port'],
-                        conn_details['username'],
-                        conn_details['password']
-                    )
-                
-                if not self.winscp_handler.connect():
-                    self.log("Failed to connect for scheduled task", "ERROR")
-                    return False
-                self.connected = True
+            # Use the interactive session's server if there is one, else
+            # the loaded configuration
+            if self.winscp_handler:
+                h = self.winscp_handler
+                conn = (h.host, h.port, h.username, h.password, h.private_key_path, h.protocol)
+            elif self.config_manager is not None:
+                # Cached by the manager, which re-reads config.ini on change
+                c = self.config_manager.get_connection_details()
+                conn = (c['host'], c['port'], c['username'], c['password'],
+                        c['private_key_path'], c['protocol'])
+            else:
+                self.log("Configuration not loaded, cannot run scheduled task", "ERROR")
+                return False
             
-            # Execute task based on type
-            if task.task_type == TaskType.UPLOAD:
-                return self.winscp_handler.upload_file(task.source_path, task.dest_path)
-            elif task.task_type == TaskType.DOWNLOAD:
-                return self.winscp_handler.download_file(task.source_path, task.dest_path)
-            elif task.task_type == TaskType.DELETE:
-                return self.winscp_handler.delete_file(task.source_path)
+            # Each task borrows a pooled connection, so concurrent tasks don't
+            # share one SFTP channel and back-to-back tasks skip the handshake
+            handler = WinSCPHandler.acquire(*conn)
+            if handler is None:
+                self.log("Failed to connect for scheduled task", "ERROR")
+                return False
             
-            return False
+            try:
+                # Execute task based on type
+                if task.task_type == TaskType.UPLOAD:
+                    return handler.upload_file(task.source_path, task.dest_path)
+                elif task.task_type == TaskType.DOWNLOAD:
+                    return handler.download_file(task.source_path, task.dest_path)
+                elif task.task_type == TaskType.DELETE:
+                    return handler.delete_file(task.source_path)
+                
+                return False
+            finally:
+                handler.release()
         except Exception as e:
             self.log(f"Task execution error: {str(e)}", "ERROR")
             return False
     
     def refresh_tasks(self):
         """Refresh tasks list"""
-        if not self.scheduler:
+        # Nothing to refresh until the Scheduler tab has been built
+        if not self.scheduler or not hasattr(self, 'tasks_tree'):
             return
         
-        # Clear current items
-        for item in self.tasks_tree.get_children():
-            self.tasks_tree.delete(item)
-        
-        # Add tasks
+        # (full task ID, row values); the full ID doubles as the row's iid
+        rows = []
         for task in self.scheduler.get_all_tasks():
-            self.tasks_tree.insert('', 'end', values=(
-                task.task_id[:8],
+            task_id = task.task_id
+            dest_path = task.dest_path
+            next_run = task.next_run
+            rows.append((task_id, (
+                task_id[:8],
                 task.task_type.value,
                 task.source_path[:30],
-                task.dest_path[:30] if task.dest_path else 'N/A',
-                task.next_run.strftime('%Y-%m-%d %H:%M') if task.next_run else 'N/A',
+                dest_path[:30] if dest_path else 'N/A',
+                _format_next_run(next_run) if next_run else 'N/A',
                 task.status.value
-            ))
+            )))
+        
+        # Nothing changed since the last refresh, keep the current rows
+        if rows == self._last_task_rows:
+            return
+        self._last_task_rows = rows
+        
+        # Hand the widget work to the next idle cycle; refreshes requested
+        # before then are coalesced into the latest rows
+        if self._pending_task_rows is None:
+            self.root.after_idle(self._bulk_insert)
+        self._pending_task_rows = rows
+    
+    def _bulk_insert(self):
+        """Replace the task list rows in one batch (Tk idle callback)"""
+        rows = self._pending_task_rows
+        self._pending_task_rows = None
+        if rows is None:
+            return
+        
+        # Detach the scrollbar so it is not updated once per inserted row
+        yscrollcommand = self.tasks_tree.cget('yscrollcommand')
+        self.tasks_tree.configure(yscrollcommand='')
+        try:
+            # Clear current items (single Tcl call) and add tasks
+            self.tasks_tree.delete(*self.tasks_tree.get_children())
+            for task_id, values in rows:
+                self.tasks_tree.insert('', 'end', iid=task_id, values=values)
+        finally:
+            self.tasks_tree.configure(yscrollcommand=yscrollcommand)
+            self.tasks_scrollbar.set(*self.tasks_tree.yview())
     
     def remove_selected_task(self):
         """Remove selected task"""
@@ -532,16 +701,11 @@ class WinSCPManagerGUI:
             messagebox.showwarning("Warning", "No task selected")
             return
         
-        item = self.tasks_tree.item(selection[0])
-        task_id_short = item['values'][0]
-        
-        # Find full task ID
-        for task in self.scheduler.get_all_tasks():
-            if task.task_id.startswith(task_id_short):
-                if self.scheduler.remove_task(task.task_id):
-                    self.log(f"Removed task: {task.task_id}")
-                    self.refresh_tasks()
-                    break
+        # Rows are inserted with the full task ID as their iid
+        task_id = selection[0]
+        if self.scheduler.remove_task(task_id):
+            self.log(f"Removed task: {task_id}")
+            self.refresh_tasks()
     
     def toggle_scheduler(self):
         """Start/stop scheduler"""
@@ -562,29 +726,78 @@ class WinSCPManagerGUI:
     
     def log(self, message: str, level: str = "INFO"):
         """Log message"""
-        if level == "ERROR":
-            logging.error(message)
-        else:
-            logging.info(message)
+        self._log_dispatch.get(level, self._log_default)(message)
 
 
 class TextHandler(logging.Handler):
     """Custom logging handler for tkinter Text widget"""
     
-    def __init__(self, text_widget):
+    # Once the widget grows past max_lines, the oldest trim_lines are dropped
+    max_lines = 5000
+    trim_lines = 1000
+    
+    # How often, in milliseconds, the Tk main loop drains queued records
+    flush_delay_ms = 50
+    
+    def __init__(self, text_widget=None):
         logging.Handler.__init__(self)
+        self.text_widget = None
+        # deque append/popleft are thread safe; bounded while no widget drains it
+        self.pending = collections.deque(maxlen=self.max_lines)
+        self._after_id = None
+        if text_widget is not None:
+            self.attach(text_widget)
+    
+    def attach(self, text_widget):
+        """
+        Write records to text_widget from now on (call from the Tk thread)
+        
+        Args:
+            text_widget: Target Text widget, or None to only buffer records
+        """
+        if self._after_id is not None:
+            try:
+                self.text_widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        
         self.text_widget = text_widget
+        if text_widget is not None:
+            self._after_id = text_widget.after(self.flush_delay_ms, self._drain)
     
     def emit(self, record):
-        msg = self.format(record)
+        # May run on any thread; only the Tk thread touches the widget
+        self.pending.append(self.format(record))
+    
+    def _drain(self):
+        """Write all queued records in one batch, then re-arm the timer"""
+        widget = self.text_widget
+        self._after_id = None
+        if widget is None:
+            return
         
-        def append():
-            self.text_widget.configure(state='normal')
-            self.text_widget.insert(tk.END, msg + '\n')
-            self.text_widget.configure(state='disabled')
-            self.text_widget.yview(tk.END)
+        messages = []
+        while self.pending:
+            messages.append(self.pending.popleft())
         
-        self.text_widget.after(0, append)
+        try:
+            if messages:
+                widget.configure(state='normal')
+                widget.insert(tk.END, '\n'.join(messages) + '\n')
+                self._trim()
+                widget.configure(state='disabled')
+                widget.yview(tk.END)
+            self._after_id = widget.after(self.flush_delay_ms, self._drain)
+        except tk.TclError:
+            # Widget was destroyed; keep buffering until attach() is called again
+            self.text_widget = None
+    
+    def _trim(self):
+        """Keep the widget bounded so long sessions do not slow it down"""
+        lines = int(self.text_widget.index('end-1c').split('.')[0])
+        if lines > self.max_lines:
+            self.text_widget.delete('1.0', f'{self.trim_lines + 1}.0')
 
 
 def run_gui():
@@ -592,3 +805,4 @@ def run_gui():
     root = tk.Tk()
     app = WinSCPManagerGUI(root)
     root.mainloop()
+    WinSCPHandler.close_pool()
@@ -2,15 +2,67 @@
 Task Scheduler for automated file operations
 """
 
+import asyncio
+import atexit
+import weakref
+import heapq
 import json
 import os
 import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Set, Tuple
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _dumps_line(data) -> bytes:
+    """Serialize data to one compact JSON line for the change log"""
+    if orjson is not None:
+        return orjson.dumps(data) + b'\n'
+    return json.dumps(data, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int, int]]:
+    """Identify a file's current contents as (inode, mtime_ns, size), None if missing"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _flush_at_exit(ref: 'weakref.ref') -> None:
+    """atexit hook that flushes a scheduler only if it is still alive"""
+    scheduler = ref()
+    if scheduler is not None:
+        scheduler.flush()
+
+
+def _loads(payload: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Longest the scheduler loop sleeps without a due task, so wall-clock
+# changes are noticed even when nothing wakes it
+_MAX_IDLE_WAIT = 60.0
+
 
 class TaskType(Enum):
     """Types of scheduled tasks"""
@@ -19,6 +71,10 @@ class TaskType(Enum):
     DELETE = "delete"
 
 
+# Plain dict lookups for deserialization, cheaper than Enum.__call__
+TaskType._VALUE_MAP = {member.value: member for member in TaskType}
+
+
 class TaskStatus(Enum):
     """Task execution status"""
     PENDING = "pending"
@@ -28,9 +84,16 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+TaskStatus._VALUE_MAP = {member.value: member for member in TaskStatus}
+
+
 class ScheduledTask:
     """Represents a scheduled task"""
     
+    __slots__ = ('task_id', 'task_type', 'source_path', 'dest_path', 'scheduled_time',
+                 'recurring', 'interval_minutes', 'status', 'last_run', 'next_run',
+                 'error_message', '_dict_cache', '_dirty', '_next_run_ts')
+    
     def __init__(self, task_id: str, task_type: TaskType, 
                  source_path: str, dest_path: str = "",
                  scheduled_time: Optional[datetime] = None,
@@ -47,6 +110,8 @@ class ScheduledTask:
             recurring: Whether task should repeat
             interval_minutes: Interval for recurring tasks
         """
+        self._dict_cache = None
+        self._dirty = True
         self.task_id = task_id
         self.task_type = task_type
         self.source_path = source_path
@@ -59,39 +124,103 @@ class ScheduledTask:
         self.next_run = self.scheduled_time
         self.error_message = ""
     
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Any change to public task state invalidates the cached to_dict()
+        if name[0] != '_':
+            object.__setattr__(self, '_dirty', True)
+            if name == 'next_run':
+                # POSIX timestamp mirror, so the scheduler compares floats
+                object.__setattr__(self, '_next_run_ts',
+                                   value.timestamp() if value is not None else None)
+    
     def to_dict(self) -> Dict:
-        """Convert task to dictionary"""
-        return {
-            'task_id': self.task_id,
-            'task_type': self.task_type.value,
-            'source_path': self.source_path,
-            'dest_path': self.dest_path,
-            'scheduled_time': self.scheduled_time.isoformat(),
-            'recurring': self.recurring,
-            'interval_minutes': self.interval_minutes,
-            'status': self.status.value,
-            'last_run': self.last_run.isoformat() if self.last_run else None,
-            'next_run': self.next_run.isoformat() if self.next_run else None,
-            'error_message': self.error_message
-        }
+        """
+        Convert task to dictionary
+        
+        The result is cached until a task attribute changes, so callers
+        must treat it as read-only.
+        """
+        if not self._dirty:
+            return self._dict_cache
+        
+        # Clear the flag before reading the fields: a change made by another
+        # thread while the dict is built sets it again, so the next call
+        # rebuilds instead of trusting a stale cache
+        self._dirty = False
+        try:
+            data = {
+                'task_id': self.task_id,
+                'task_type': self.task_type.value,
+                'source_path': self.source_path,
+                'dest_path': self.dest_path,
+                'scheduled_time': self.scheduled_time.isoformat(),
+                'recurring': self.recurring,
+                'interval_minutes': self.interval_minutes,
+                'status': self.status.value,
+                'last_run': self.last_run.isoformat() if self.last_run else None,
+                'next_run': self.next_run.isoformat() if self.next_run else None,
+                'error_message': self.error_message
+            }
+        except Exception:
+            # Never leave a clean flag over a cache that wasn't built
+            self._dirty = True
+            raise
+        self._dict_cache = data
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'ScheduledTask':
         """Create task from dictionary"""
-        task = cls(
-            task_id=data['task_id'],
-            task_type=TaskType(data['task_type']),
-            source_path=data['source_path'],
-            dest_path=data.get('dest_path', ''),
-            scheduled_time=datetime.fromisoformat(data['scheduled_time']),
-            recurring=data.get('recurring', False),
-            interval_minutes=data.get('interval_minutes', 0)
-        )
-        task.status = TaskStatus(data.get('status', 'pending'))
-        task.last_run = datetime.fromisoformat(data['last_run']) if data.get('last_run') else None
-        task.next_run = datetime.fromisoformat(data['next_run']) if data.get('next_run') else None
-        task.error_message = data.get('error_message', '')
-        return task
+        return cls._bulk_load([data])[0]
+    
+    @classmethod
+    def _bulk_load(cls, raw_list: List[Dict]) -> List['ScheduledTask']:
+        """
+        Build many tasks from dictionaries in one pass
+        
+        Equivalent to calling from_dict() per entry, but fills the slots
+        directly instead of going through __init__ and __setattr__.
+        
+        Args:
+            raw_list: Task dictionaries as written by to_dict()
+            
+        Returns:
+            List of tasks in input order
+        """
+        new = cls.__new__
+        set_ = object.__setattr__
+        fromisoformat = datetime.fromisoformat
+        task_types = TaskType._VALUE_MAP
+        statuses = TaskStatus._VALUE_MAP
+        
+        tasks = []
+        for data in raw_list:
+            task = new(cls)
+            get = data.get
+            set_(task, 'task_id', data['task_id'])
+            set_(task, 'task_type', task_types[data['task_type']])
+            set_(task, 'source_path', data['source_path'])
+            set_(task, 'dest_path', get('dest_path', ''))
+            set_(task, 'scheduled_time', fromisoformat(data['scheduled_time']))
+            set_(task, 'recurring', get('recurring', False))
+            set_(task, 'interval_minutes', get('interval_minutes', 0))
+            set_(task, 'status', statuses[get('status', 'pending')])
+            last_run = get('last_run')
+            set_(task, 'last_run', fromisoformat(last_run) if last_run else None)
+            next_run = get('next_run')
+            if next_run:
+                next_run = fromisoformat(next_run)
+                set_(task, 'next_run', next_run)
+                set_(task, '_next_run_ts', next_run.timestamp())
+            else:
+                set_(task, 'next_run', None)
+                set_(task, '_next_run_ts', None)
+            set_(task, 'error_message', get('error_message', ''))
+            set_(task, '_dict_cache', None)
+            set_(task, '_dirty', True)
+            tasks.append(task)
+        return tasks
 
 
 class TaskScheduler:
@@ -102,14 +231,58 @@ class TaskScheduler:
         Initialize task scheduler
         
         Args:
-            tasks_file: Path to tasks storage file
+            tasks_file: Path to tasks snapshot file; the change log is kept
+                beside it with a .jsonl extension
         """
         self.tasks_file = tasks_file
+        # Change log replayed on top of the tasks_file snapshot
+        self.log_file = os.path.splitext(tasks_file)[0] + '.jsonl'
         self.tasks: Dict[str, ScheduledTask] = {}
+        # Guards changes to, and iteration over, self.tasks across the UI,
+        # scheduler, worker and writer threads
+        self._lock = threading.RLock()
         self.running = False
         self.scheduler_thread = None
         self.task_executor: Optional[Callable] = None
         self.logger = logging.getLogger(__name__)
+        
+        # Min-heap of (next-run timestamp, task_id). Entries are not removed
+        # when a task is removed or rescheduled; stale ones are skipped on pop.
+        # This is the only state the loop touches per tick: it reads
+        # heap[0] and pops the due prefix, never scanning the task objects.
+        self._heap: List[Tuple[float, str]] = []
+        self._heap_lock = threading.Lock()
+        # Set to cut the scheduler's sleep short (new task, stop)
+        self._wake_event = threading.Event()
+        # Set while run() drives the scheduler from an asyncio loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_wake: Optional[asyncio.Event] = None
+        
+        # Due tasks run on a bounded pool so slow transfers overlap
+        # instead of queueing behind each other on the scheduler thread
+        self.max_workers = 8
+        self._pool: Optional[ThreadPoolExecutor] = None
+        
+        # Debounced persistence: changed task IDs collect in _changed and a
+        # background writer appends them to the change log at most once per
+        # save_delay seconds, compacting into a snapshot every compact_every
+        # records
+        self.save_delay = 0.25
+        self.compact_every = 500
+        self._changed: Set[str] = set()
+        # Records this instance appended since its last compaction
+        self._log_records = 0
+        # What the files looked like when this instance last read or wrote
+        # them; compaction is skipped if another scheduler has touched them
+        self._log_offset = 0
+        self._snapshot_stamp: Optional[Tuple[int, int, int]] = None
+        self._save_pending = threading.Event()
+        self._save_lock = threading.Lock()
+        self._writer_lock = threading.Lock()
+        self._writer_thread = None
+        # Weak, so a replaced scheduler doesn't flush stale state at exit
+        atexit.register(_flush_at_exit, weakref.ref(self))
+        
         self.load_tasks()
     
     def set_task_executor(self, executor: Callable) -> None:
@@ -120,6 +293,7 @@ class TaskScheduler:
             executor: Callable that takes a ScheduledTask and executes it
         """
         self.task_executor = executor
+        self._rebuild_heap()
     
     def add_task(self, task: ScheduledTask) -> None:
         """
@@ -128,8 +302,10 @@ class TaskScheduler:
         Args:
             task: ScheduledTask to add
         """
-        self.tasks[task.task_id] = task
-        self.save_tasks()
+        with self._lock:
+            self.tasks[task.task_id] = task
+        self._push(task)
+        self._request_save(task.task_id)
         self.logger.info(f"Added task: {task.task_id}")
     
     def remove_task(self, task_id: str) -> bool:
@@ -142,9 +318,10 @@ class TaskScheduler:
         Returns:
             True if removed, False if not found
         """
-        if task_id in self.tasks:
-            del self.tasks[task_id]
-            self.save_tasks()
+        with self._lock:
+            removed = self.tasks.pop(task_id, None) is not None
+        if removed:
+            self._request_save(task_id)
             self.logger.info(f"Removed task: {task_id}")
             return True
         return False
@@ -153,9 +330,28 @@ class TaskScheduler:
         """Get task by ID"""
         return self.tasks.get(task_id)
     
+    def find_task_by_prefix(self, prefix: str) -> Optional[str]:
+        """
+        Resolve a full or partial task ID
+        
+        Args:
+            prefix: Full task ID or a leading part of one
+            
+        Returns:
+            Full ID of the first matching task, None if no task matches
+        """
+        with self._lock:
+            if prefix in self.tasks:
+                return prefix
+            for task_id in self.tasks:
+                if task_id.startswith(prefix):
+                    return task_id
+        return None
+    
     def get_all_tasks(self) -> List[ScheduledTask]:
         """Get all scheduled tasks"""
-        return list(self.tasks.values())
+        with self._lock:
+            return list(self.tasks.values())
     
     def start(self) -> None:
         """Start the scheduler"""
@@ -164,33 +360,173 @@ class TaskScheduler:
             return
         
         self.running = True
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sched")
         self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.scheduler_thread.start()
         self.logger.info("Scheduler started")
     
+    async def run(self) -> None:
+        """
+        Run the scheduler on the current asyncio event loop
+        
+        Alternative to start() for applications that already own an event
+        loop. Blocking task executors run on the worker pool through
+        run_in_executor. Returns after stop() once running tasks finish.
+        """
+        if self.running:
+            self.logger.warning("Scheduler already running")
+            return
+        
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._async_wake = asyncio.Event()
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sched")
+        self.running = True
+        self.logger.info("Scheduler started")
+        
+        in_flight = set()
+        try:
+            while self.running:
+                self._async_wake.clear()
+                try:
+                    due = self._take_due()
+                    for index, task in enumerate(due):
+                        try:
+                            future = loop.run_in_executor(self._pool, self._execute_task, task)
+                        except Exception:
+                            self._requeue(due[index:])
+                            raise
+                        in_flight.add(future)
+                        future.add_done_callback(in_flight.discard)
+                except Exception as e:
+                    self.logger.error(f"Scheduler error: {str(e)}")
+                
+                try:
+                    await asyncio.wait_for(self._async_wake.wait(),
+                                           timeout=self._seconds_until_next_run())
+                except asyncio.TimeoutError:
+                    pass
+            
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+        finally:
+            self.running = False
+            self._loop = None
+            self._async_wake = None
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self.flush()
+            self.logger.info("Scheduler stopped")
+    
     def stop(self) -> None:
         """Stop the scheduler"""
         self.running = False
+        self._wake()
+        if self._loop is not None:
+            # run() finishes its own shutdown on the event loop
+            return
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self.flush()
         self.logger.info("Scheduler stopped")
     
+    def _push(self, task: ScheduledTask) -> None:
+        """Queue a task's next run and wake the scheduler loop"""
+        if task._next_run_ts is None:
+            return
+        with self._heap_lock:
+            heapq.heappush(self._heap, (task._next_run_ts, task.task_id))
+        self._wake()
+    
+    def _rebuild_heap(self) -> None:
+        """Rebuild the run queue from all pending tasks"""
+        pending = TaskStatus.PENDING
+        with self._lock:
+            heap = [(task._next_run_ts, task.task_id) for task in self.tasks.values()
+                    if task.status is pending and task._next_run_ts is not None]
+        heapq.heapify(heap)
+        with self._heap_lock:
+            self._heap = heap
+        self._wake()
+    
+    def _wake(self) -> None:
+        """Cut the scheduler loop's current sleep short"""
+        self._wake_event.set()
+        loop, event = self._loop, self._async_wake
+        if loop is not None and event is not None:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Event loop already closed
+                pass
+    
+    def _seconds_until_next_run(self) -> float:
+        """Seconds to sleep before the earliest queued run is due"""
+        with self._heap_lock:
+            if not self._heap:
+                return _MAX_IDLE_WAIT
+            next_run_ts = self._heap[0][0]
+        delay = next_run_ts - time.time()
+        return min(max(delay, 0.0), _MAX_IDLE_WAIT)
+    
     def _scheduler_loop(self) -> None:
         """Main scheduler loop"""
         while self.running:
+            self._wake_event.clear()
             try:
                 self._check_and_execute_tasks()
-                time.sleep(10)  # Check every 10 seconds
             except Exception as e:
                 self.logger.error(f"Scheduler error: {str(e)}")
+            # Sleep until the next task is due, or until woken
+            self._wake_event.wait(timeout=self._seconds_until_next_run())
     
-    def _check_and_execute_tasks(self) -> None:
-        """Check for due tasks and execute them"""
-        now = datetime.now()
+    def _pop_due(self, now_ts: float) -> List[ScheduledTask]:
+        """Pop every queued run that is due, skipping stale entries"""
+        due = []
+        with self._heap_lock:
+            while self._heap and self._heap[0][0] <= now_ts:
+                run_at, task_id = heapq.heappop(self._heap)
+                task = self.tasks.get(task_id)
+                if task is not None and task._next_run_ts == run_at and task.status is TaskStatus.PENDING:
+                    due.append(task)
+        return due
+    
+    def _take_due(self) -> List[ScheduledTask]:
+        """Pop the due tasks and mark them RUNNING, ready for dispatch"""
+        due = self._pop_due(time.time())
+        if not due:
+            return due
+        if not self.task_executor:
+            # Left PENDING; set_task_executor() queues them again
+            self.logger.error("No task executor set")
+            return []
         
-        for task in list(self.tasks.values()):
-            if task.status == TaskStatus.PENDING and task.next_run <= now:
-                self._execute_task(task)
+        for task in due:
+            # Mark RUNNING before dispatch so a task is never dispatched twice
+            task.status = TaskStatus.RUNNING
+        return due
+    
+    def _requeue(self, tasks: List[ScheduledTask]) -> None:
+        """Put tasks marked RUNNING by _take_due back if dispatch failed"""
+        for task in tasks:
+            task.status = TaskStatus.PENDING
+            self._push(task)
+    
+    def _check_and_execute_tasks(self) -> None:
+        """Check for due tasks and hand them to the worker pool"""
+        due = self._take_due()
+        for index, task in enumerate(due):
+            try:
+                if self._pool is None:
+                    raise RuntimeError("worker pool is not running")
+                self._pool.submit(self._execute_task, task)
+            except Exception:
+                # e.g. the pool was shut down by stop(); don't strand them RUNNING
+                self._requeue(due[index:])
+                raise
     
     def _execute_task(self, task: ScheduledTask) -> None:
         """
@@ -218,6 +554,7 @@ class TaskScheduler:
                 if task.recurring and task.interval_minutes > 0:
                     task.next_run = datetime.now() + timedelta(minutes=task.interval_minutes)
                     task.status = TaskStatus.PENDING
+                    self._push(task)
                     self.logger.info(f"Task {task.task_id} will run again at {task.next_run}")
                 else:
                     self.logger.info(f"Task completed: {task.task_id}")
@@ -231,30 +568,195 @@ class TaskScheduler:
             task.error_message = str(e)
             self.logger.error(f"Task error: {task.task_id} - {str(e)}")
         
-        self.save_tasks()
+        self._request_save(task.task_id)
+    
+    def _request_save(self, task_id: str) -> None:
+        """
+        Record a changed task and schedule a write on the background thread
+        
+        Args:
+            task_id: ID of the added, updated or removed task
+        """
+        with self._save_lock:
+            self._changed.add(task_id)
+        self._save_pending.set()
+        if self._writer_thread is None:
+            with self._writer_lock:
+                if self._writer_thread is None:
+                    self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+                    self._writer_thread.start()
+    
+    def _writer_loop(self) -> None:
+        """Coalesce save requests arriving within save_delay into one write"""
+        while True:
+            self._save_pending.wait()
+            time.sleep(self.save_delay)
+            self._save_pending.clear()
+            self._append_changes()
+            if self._log_records >= self.compact_every:
+                self.save_tasks()
+    
+    def flush(self) -> None:
+        """Write any pending changes to disk now and compact the log"""
+        self._save_pending.clear()
+        self._append_changes()
+        if self._log_records:
+            self.save_tasks()
+    
+    def _append_changes(self) -> None:
+        """Append one log record per changed task"""
+        try:
+            with self._save_lock:
+                if not self._changed:
+                    return
+                lines = []
+                for task_id in self._changed:
+                    task = self.tasks.get(task_id)
+                    if task is None:
+                        lines.append(_dumps_line({'op': 'del', 'task_id': task_id}))
+                    else:
+                        try:
+                            data = task.to_dict()
+                        except Exception as e:
+                            self.logger.error(f"Not saving task {task_id}: {str(e)}")
+                            continue
+                        lines.append(_dumps_line({'op': 'put', 'task': data}))
+                self._changed.clear()
+                
+                log_size = self._log_size()
+                with open(self.log_file, 'ab') as f:
+                    f.write(b''.join(lines))
+                    # An offset of -1 marks a log another scheduler wrote to
+                    self._log_offset = f.tell() if log_size == self._log_offset else -1
+                self._log_records += len(lines)
+        except Exception as e:
+            self.logger.error(f"Failed to save tasks: {str(e)}")
+    
+    def _log_size(self) -> int:
+        """Current size of the change log in bytes"""
+        try:
+            return os.path.getsize(self.log_file)
+        except FileNotFoundError:
+            return 0
     
     def save_tasks(self) -> None:
-        """Save tasks to file"""
+        """Save a full snapshot of all tasks and truncate the change log"""
         try:
-            tasks_data = [task.to_dict() for task in self.tasks.values()]
-            with open(self.tasks_file, 'w') as f:
-                json.dump(tasks_data, f, indent=2)
+            with self._save_lock:
+                if self._files_changed():
+                    # Another scheduler wrote these files since we read them:
+                    # fold its changes in before the snapshot replaces them
+                    self._rebase()
+                    if self._files_changed():
+                        self.logger.warning("Tasks file changed while compacting, retrying later")
+                        return
+                
+                tasks_data = []
+                with self._lock:
+                    for task in self.tasks.values():
+                        try:
+                            tasks_data.append(task.to_dict())
+                        except Exception as e:
+                            self.logger.error(f"Not saving task {task.task_id}: {str(e)}")
+                payload = _dumps(tasks_data)
+                
+                # Write a sibling file and swap it in, so a crash mid-write
+                # never leaves a truncated tasks file behind
+                tmp_file = f"{self.tasks_file}.tmp"
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.tasks_file)
+                self._snapshot_stamp = _file_stamp(self.tasks_file)
+                
+                # Every logged change is now in the snapshot. Replaying the
+                # log over it after a crash here would be harmless, since
+                # each task's last record matches the snapshot.
+                with open(self.log_file, 'wb'):
+                    pass
+                self._log_offset = 0
+                self._log_records = 0
         except Exception as e:
             self.logger.error(f"Failed to save tasks: {str(e)}")
     
-    def load_tasks(self) -> None:
-        """Load tasks from file"""
-        if not os.path.exists(self.tasks_file):
-            return
+    def _files_changed(self) -> bool:
+        """True if the snapshot or log differ from what this instance last saw"""
+        return (self._log_size() != self._log_offset
+                or _file_stamp(self.tasks_file) != self._snapshot_stamp)
+    
+    def _rebase(self) -> None:
+        """
+        Merge tasks written by another scheduler into this instance
         
+        Tasks this instance holds keep their in-memory objects (its changes
+        are already in the log); tasks only on disk are added, and tasks
+        missing from disk are dropped unless this instance has unsaved
+        changes to them.
+        """
+        disk_tasks, snapshot_stamp, log_offset, _ = self._read_files()
+        with self._lock:
+            merged = {}
+            for task_id, task in disk_tasks.items():
+                if task_id in self.tasks:
+                    merged[task_id] = self.tasks[task_id]
+                elif task_id not in self._changed:
+                    merged[task_id] = task
+            for task_id in self._changed:
+                if task_id in self.tasks:
+                    merged[task_id] = self.tasks[task_id]
+            self.tasks = merged
+        self._snapshot_stamp = snapshot_stamp
+        self._log_offset = log_offset
+        self._rebuild_heap()
+    
+    def _read_files(self) -> Tuple[Dict[str, ScheduledTask], Optional[Tuple[int, int, int]], int, bool]:
+        """
+        Read the snapshot and replay the change log over it
+        
+        Returns:
+            (tasks by ID, snapshot stamp, log size, True if every log record
+            was applied)
+        """
+        tasks: Dict[str, ScheduledTask] = {}
+        snapshot_stamp = _file_stamp(self.tasks_file)
+        if snapshot_stamp is not None:
+            with open(self.tasks_file, 'rb') as f:
+                tasks_data = _loads(f.read())
+            tasks = {task.task_id: task for task in ScheduledTask._bulk_load(tasks_data)}
+        
+        log_offset = 0
+        clean = True
+        if os.path.exists(self.log_file):
+            log_offset = self._log_size()
+            with open(self.log_file, 'rb') as f:
+                for number, line in enumerate(f, 1):
+                    # A bad record (torn by a crash mid-append, or otherwise
+                    # unreadable) is skipped; the rest still apply
+                    try:
+                        record = _loads(line)
+                        if record['op'] == 'del':
+                            tasks.pop(record['task_id'], None)
+                        else:
+                            task = ScheduledTask.from_dict(record['task'])
+                            tasks[task.task_id] = task
+                    except Exception as e:
+                        self.logger.warning(f"Skipping bad record {number} in {self.log_file}: {str(e)}")
+                        clean = False
+        return tasks, snapshot_stamp, log_offset, clean
+    
+    def load_tasks(self) -> None:
+        """Load tasks from the snapshot file, then replay the change log"""
         try:
-            with open(self.tasks_file, 'r') as f:
-                tasks_data = json.load(f)
+            tasks, snapshot_stamp, log_offset, clean = self._read_files()
             
-            self.tasks = {}
-            for task_data in tasks_data:
-                task = ScheduledTask.from_dict(task_data)
-                self.tasks[task.task_id] = task
+            with self._lock:
+                self.tasks = tasks
+            self._snapshot_stamp = snapshot_stamp
+            self._log_offset = log_offset
+            self._log_records = 0
+            self._rebuild_heap()
+            if not clean:
+                # Start a clean log so new records don't follow a bad line
+                self.save_tasks()
             
             self.logger.info(f"Loaded {len(self.tasks)} tasks")
         except Exception as e:
@@ -3,18 +3,126 @@ WinSCP Protocol Handler for file operations
 """
 
 import os
+import posixpath
+import threading
+import time
 import logging
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Set, Dict, Tuple, Iterator
 from pathlib import Path
 import paramiko
 from stat import S_ISDIR
 
 
+# SSH channel sizing for SFTP sessions, large enough to keep long-RTT
+# links busy
+DEFAULT_WINDOW_SIZE = 2 ** 27
+DEFAULT_MAX_PACKET_SIZE = 2 ** 19
+
+# Idle connections handed out by WinSCPHandler.acquire(), keyed by
+# (host, port, username); each entry is (released_at, handler)
+POOL_MAX_IDLE = 4
+POOL_IDLE_TIMEOUT = 300.0
+_POOL: Dict[Tuple[str, int, str], List[Tuple[float, 'WinSCPHandler']]] = {}
+_POOL_LOCK = threading.Lock()
+_reaper_thread: Optional[threading.Thread] = None
+
+
+# Progress callbacks are forwarded at most this often (plus the final
+# update); this is the only progress throttle, UI callbacks just render
+_PROGRESS_INTERVAL = 0.05
+
+
+def _sampled_progress(callback: Optional[Callable]) -> Optional[Callable]:
+    """
+    Wrap a progress callback so per-packet updates are thinned out
+    
+    Args:
+        callback: Callback taking (transferred, total), or None
+        
+    Returns:
+        Throttled callback, or None when no callback was given
+    """
+    if callback is None:
+        return None
+    last = [0.0]  # timestamp of the last forwarded update
+    
+    def sampled(transferred: int, total: int) -> None:
+        now = time.monotonic()
+        if transferred >= total or now - last[0] > _PROGRESS_INTERVAL:
+            last[0] = now
+            callback(transferred, total)
+    
+    return sampled
+
+
+# Parsed private keys by path, as (mtime, key), so reconnects and new
+# pooled connections don't re-read and re-parse the key file
+_KEY_CACHE: Dict[str, Tuple[float, 'paramiko.PKey']] = {}
+
+
+def _load_private_key(path: str) -> 'paramiko.PKey':
+    """
+    Load a private key file of any supported type
+    
+    Args:
+        path: Path to private key file
+        
+    Returns:
+        Parsed key, tried as Ed25519, then ECDSA, then RSA
+    """
+    mtime = os.stat(path).st_mtime
+    cached = _KEY_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    error = None
+    for key_cls in (paramiko.Ed25519Key, paramiko.ECDSAKey, paramiko.RSAKey):
+        try:
+            key = key_cls.from_private_key_file(path)
+            break
+        except paramiko.PasswordRequiredException:
+            raise
+        except paramiko.SSHException as e:
+            error = e
+    else:
+        raise error
+    
+    _KEY_CACHE[path] = (mtime, key)
+    return key
+
+
+def _reap_idle_connections() -> None:
+    """Close pooled connections left idle longer than POOL_IDLE_TIMEOUT"""
+    while True:
+        time.sleep(POOL_IDLE_TIMEOUT / 4)
+        cutoff = time.monotonic() - POOL_IDLE_TIMEOUT
+        expired = []
+        with _POOL_LOCK:
+            for key, idle in list(_POOL.items()):
+                expired.extend(handler for released_at, handler in idle if released_at < cutoff)
+                idle[:] = [entry for entry in idle if entry[0] >= cutoff]
+                if not idle:
+                    del _POOL[key]
+        for handler in expired:
+            handler.disconnect()
+
+
+def _start_reaper() -> None:
+    """Start the idle-connection reaper the first time the pool is used"""
+    global _reaper_thread
+    with _POOL_LOCK:
+        if _reaper_thread is None:
+            _reaper_thread = threading.Thread(target=_reap_idle_connections, daemon=True)
+            _reaper_thread.start()
+
+
 class WinSCPHandler:
     """Handles WinSCP/SFTP protocol operations"""
     
     def __init__(self, host: str, port: int, username: str, 
-                 password: str = '', private_key_path: str = '', protocol: str = 'sftp'):
+                 password: str = '', private_key_path: str = '', protocol: str = 'sftp',
+                 window_size: int = DEFAULT_WINDOW_SIZE,
+                 max_packet_size: int = DEFAULT_MAX_PACKET_SIZE):
         """
         Initialize WinSCP handler
         
@@ -25,6 +133,8 @@ class WinSCPHandler:
             password: Password for authentication (optional if using key)
             private_key_path: Path to private key file (optional)
             protocol: Protocol to use (sftp, scp)
+            window_size: SSH channel window in bytes
+            max_packet_size: Largest SSH channel packet in bytes
         """
         self.host = host
         self.port = port
@@ -32,10 +142,15 @@ class WinSCPHandler:
         self.password = password
         self.private_key_path = private_key_path
         self.protocol = protocol
+        self.window_size = window_size
+        self.max_packet_size = max_packet_size
         
         self.ssh_client = None
         self.sftp_client = None
         self.logger = logging.getLogger(__name__)
+        
+        # Remote directories known to exist in this session
+        self._known_dirs: Set[str] = {'/'}
     
     def connect(self) -> bool:
         """
@@ -50,7 +165,7 @@ class WinSCPHandler:
             
             # Connect with key or password
             if self.private_key_path and os.path.exists(self.private_key_path):
-                private_key = paramiko.RSAKey.from_private_key_file(self.private_key_path)
+                private_key = _load_private_key(self.private_key_path)
                 self.ssh_client.connect(
                     self.host,
                     port=self.port,
@@ -65,6 +180,12 @@ class WinSCPHandler:
                     password=self.password
                 )
             
+            # paramiko's 2 MB window / 32 KB packet defaults cap throughput on
+            # high-latency links; they must be raised before the channel opens
+            transport = self.ssh_client.get_transport()
+            transport.default_window_size = self.window_size
+            transport.default_max_packet_size = self.max_packet_size
+            
             self.sftp_client = self.ssh_client.open_sftp()
             self.logger.info(f"Connected to {self.host}:{self.port}")
             return True
@@ -73,12 +194,82 @@ class WinSCPHandler:
             self.logger.error(f"Connection failed: {str(e)}")
             return False
     
+    @classmethod
+    def acquire(cls, host: str, port: int, username: str, password: str = '',
+                private_key_path: str = '', protocol: str = 'sftp') -> Optional['WinSCPHandler']:
+        """
+        Get a connected handler from the pool, connecting a new one if needed
+        
+        Args:
+            host: Server hostname or IP
+            port: Connection port
+            username: Username for authentication
+            password: Password for authentication (optional if using key)
+            private_key_path: Path to private key file (optional)
+            protocol: Protocol to use (sftp, scp)
+            
+        Returns:
+            Connected handler to hand back with release(), None if the
+            connection failed
+        """
+        key = (host, port, username)
+        while True:
+            with _POOL_LOCK:
+                idle = _POOL.get(key)
+                if not idle:
+                    break
+                _, handler = idle.pop()
+            if handler.is_alive():
+                return handler
+            handler.disconnect()
+        
+        handler = cls(host, port, username, password, private_key_path, protocol)
+        if not handler.connect():
+            return None
+        _start_reaper()
+        return handler
+    
+    def release(self) -> None:
+        """Return a handler obtained from acquire() to the pool"""
+        if self.sftp_client is not None:
+            with _POOL_LOCK:
+                idle = _POOL.setdefault((self.host, self.port, self.username), [])
+                if len(idle) < POOL_MAX_IDLE:
+                    idle.append((time.monotonic(), self))
+                    return
+        self.disconnect()
+    
+    @classmethod
+    def close_pool(cls) -> None:
+        """Disconnect every idle pooled connection"""
+        with _POOL_LOCK:
+            handlers = [handler for idle in _POOL.values() for _, handler in idle]
+            _POOL.clear()
+        for handler in handlers:
+            handler.disconnect()
+    
+    def is_alive(self) -> bool:
+        """
+        Check the SFTP session still answers requests
+        
+        Returns:
+            True if the connection is usable, False otherwise
+        """
+        if self.sftp_client is None:
+            return False
+        try:
+            self.sftp_client.stat('.')
+            return True
+        except Exception:
+            return False
+    
     def disconnect(self) -> None:
         """Close connection to remote server"""
         if self.sftp_client:
             self.sftp_client.close()
         if self.ssh_client:
             self.ssh_client.close()
+        self._known_dirs = {'/'}
         self.logger.info("Disconnected from server")
     
     def upload_file(self, local_path: str, remote_path: str, 
@@ -95,27 +286,24 @@ class WinSCPHandler:
             True if upload successful, False otherwise
         """
         try:
-            if not os.path.exists(local_path):
+            # One stat both checks the file exists and gives its size
+            try:
+                file_size = os.stat(local_path).st_size
+            except FileNotFoundError:
                 self.logger.error(f"Local file not found: {local_path}")
                 return False
             
             # Ensure remote directory exists
-            remote_dir = os.path.dirname(remote_path)
+            remote_dir = posixpath.dirname(remote_path)
             self._ensure_remote_dir(remote_dir)
             
-            file_size = os.path.getsize(local_path)
             self.logger.info(f"Uploading {local_path} to {remote_path} ({file_size} bytes)")
             
-            if progress_callback:
-                transferred = [0]
-                
-                def callback(sent, total):
-                    transferred[0] = sent
-                    progress_callback(sent, total)
-                
-                self.sftp_client.put(local_path, remote_path, callback=callback)
-            else:
-                self.sftp_client.put(local_path, remote_path)
+            # putfo pipelines the writes; passing the size we already have
+            # saves put() from stat-ing the local file again
+            with open(local_path, 'rb') as local_file:
+                self.sftp_client.putfo(local_file, remote_path, file_size=file_size,
+                                       callback=_sampled_progress(progress_callback))
             
             self.logger.info(f"Upload completed: {remote_path}")
             return True
@@ -145,15 +333,12 @@ class WinSCPHandler:
             
             self.logger.info(f"Downloading {remote_path} to {local_path}")
             
-            if progress_callback:
-                def callback(received, total):
-                    progress_callback(received, total)
-                
-                self.sftp_client.get(remote_path, local_path, callback=callback)
-            else:
-                self.sftp_client.get(remote_path, local_path)
+            # getfo stats the file, prefetches it and reports progress itself
+            with open(local_path, 'wb') as local_file:
+                received = self.sftp_client.getfo(remote_path, local_file,
+                                                  callback=_sampled_progress(progress_callback))
             
-            self.logger.info(f"Download completed: {local_path}")
+            self.logger.info(f"Download completed: {local_path} ({received} bytes)")
             return True
             
         except Exception as e:
@@ -196,6 +381,23 @@ class WinSCPHandler:
             self.logger.error(f"Failed to list files: {str(e)}")
             return []
     
+    def iter_files(self, remote_path: str) -> Iterator[str]:
+        """
+        Stream the files in a remote directory
+        
+        Names are yielded as the server returns them, so callers can stop
+        early without waiting for the whole listing. Errors propagate from
+        the iteration instead of being logged.
+        
+        Args:
+            remote_path: Remote directory path
+            
+        Yields:
+            File names
+        """
+        for attr in self.sftp_client.listdir_iter(remote_path):
+            yield attr.filename
+    
     def file_exists(self, remote_path: str) -> bool:
         """
         Check if remote file exists
@@ -222,15 +424,25 @@ class WinSCPHandler:
         Args:
             remote_dir: Remote directory path
         """
-        if not remote_dir or remote_dir == '/':
+        remote_dir = remote_dir.rstrip('/')
+        if not remote_dir or remote_dir in self._known_dirs:
             return
         
-        try:
-            self.sftp_client.stat(remote_dir)
-        except FileNotFoundError:
-            # Directory doesn't exist, create it
-            parent_dir = os.path.dirname(remote_dir)
-            if parent_dir:
-                self._ensure_remote_dir(parent_dir)
-            self.sftp_client.mkdir(remote_dir)
-            self.logger.info(f"Created remote directory: {remote_dir}")
+        # Walk up until an existing (or already known) directory is found,
+        # then create the missing levels top-down
+        missing = []
+        path = remote_dir
+        while path and path not in self._known_dirs:
+            try:
+                self.sftp_client.stat(path)
+            except FileNotFoundError:
+                missing.append(path)
+                path = posixpath.dirname(path)
+                continue
+            self._known_dirs.add(path)
+            break
+        
+        for path in reversed(missing):
+            self.sftp_client.mkdir(path)
+            self._known_dirs.add(path)
+            self.logger.info(f"Created remote directory: {path}")